@@ -1138,10 +1138,17 @@ def _has_top_level_media_type(
     if media_type is None:
         return False
 
+    # Fast path for well-formed lowercase media types like "image/png":
+    # a prefix check with a boundary test, no intermediate strings.
+    prefix_len = len(top_level_media_type)
+    if media_type.startswith(top_level_media_type) and (len(media_type) == prefix_len or media_type[prefix_len] == "/"):
+        return True
+
+    # Fallback normalizes unusual casing or whitespace. The allowed
+    # top-level types are lowercase literals, so only the span needs it.
     slash_index = media_type.find("/")
     span = media_type[:slash_index] if slash_index >= 0 else media_type
-    span = span.strip()
-    return span.lower() == top_level_media_type.lower()
+    return span.strip().lower() == top_level_media_type
 
 
 class ErrorContent(BaseContent):
@@ -15,7 +15,7 @@ from typing import Any, ClassVar, Generic, TypeVar, cast
 from .._agents import AgentProtocol
 from .._threads import AgentThread
 from .._types import AgentRunResponse, AgentRunResponseUpdate, ChatMessage
-from ..observability import create_processing_span
+from ..observability import OtelAttr, create_processing_span
 from ._checkpoint import WorkflowCheckpoint
 from ._events import (
     AgentRunEvent,
@@ -227,6 +227,11 @@ class Executor(DictConvertible):
         self.id = id
         self.type = resolved_type
         self.type_ = resolved_type
+        # Static telemetry attributes, built once here instead of per message.
+        self._otel_attributes: dict[str, str] = {
+            OtelAttr.EXECUTOR_ID: id,
+            OtelAttr.EXECUTOR_TYPE: self.__class__.__name__,
+        }
 
         from builtins import type as builtin_type
 
@@ -278,6 +283,7 @@ class Executor(DictConvertible):
             type(message).__name__,
             source_trace_contexts=trace_contexts,
             source_span_ids=source_span_ids,
+            base_attributes=getattr(self, "_otel_attributes", None),
         ):
             # Find the handler and handler spec that matches the message type.
             handler: Callable[[Any, WorkflowContext[Any, Any]], Awaitable[None]] | None = None
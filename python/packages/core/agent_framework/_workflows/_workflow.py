@@ -370,11 +370,21 @@ class Workflow(DictConvertible):
                 capture_exception(span, exception=exc)
                 raise
 
-    async def run_stream(self, message: Any) -> AsyncIterable[WorkflowEvent]:
+    async def run_stream(
+        self,
+        message: Any,
+        *,
+        event_filter: type[WorkflowEvent] | tuple[type[WorkflowEvent], ...] | None = None,
+    ) -> AsyncIterable[WorkflowEvent]:
         """Run the workflow with a starting message and stream events.
 
         Args:
             message: The message to be sent to the starting executor.
+            event_filter: Optional event type (or tuple of types) to restrict the stream to.
+                Non-matching events are dropped before they are yielded, saving callers that
+                only care about a specific event type (e.g. WorkflowOutputEvent) an isinstance
+                check per event in their loop. The workflow still executes in full and every
+                event is still produced internally; only what reaches the caller changes.
 
         Yields:
             WorkflowEvent: The events generated during the workflow execution.
@@ -396,7 +406,8 @@ class Workflow(DictConvertible):
             async for event in self._run_workflow_with_tracing(
                 initial_executor_fn=initial_execution, reset_context=True
             ):
-                yield event
+                if event_filter is None or isinstance(event, event_filter):
+                    yield event
         finally:
             self._reset_running_flag()
 
@@ -23,7 +23,8 @@ if TYPE_CHECKING:  # pragma: no cover
     from opentelemetry.sdk._logs._internal.export import LogExporter
     from opentelemetry.sdk.metrics.export import MetricExporter
     from opentelemetry.sdk.resources import Resource
-    from opentelemetry.sdk.trace.export import SpanExporter
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanProcessor
+    from opentelemetry.sdk.trace.sampling import Sampler
     from opentelemetry.trace import Tracer
     from opentelemetry.util._decorator import _AgnosticContextManager  # type: ignore[reportPrivateUsage]
 
@@ -387,6 +388,8 @@ class ObservabilitySettings(AFBaseSettings):
     vs_code_extension_port: int | None = None
     _resource: "Resource" = PrivateAttr(default_factory=_create_resource)
     _executed_setup: bool = PrivateAttr(default=False)
+    _sampler: "Sampler | None" = PrivateAttr(default=None)
+    _span_processor_factory: "Callable[[SpanExporter], SpanProcessor] | None" = PrivateAttr(default=None)
 
     @property
     def ENABLED(self) -> bool:
@@ -495,17 +498,23 @@ class ObservabilitySettings(AFBaseSettings):
         from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
 
         # Tracing
-        tracer_provider = TracerProvider(resource=self.resource)
+        # When no sampler is given, the SDK falls back to the
+        # OTEL_TRACES_SAMPLER / OTEL_TRACES_SAMPLER_ARG environment variables.
+        tracer_provider = TracerProvider(resource=self.resource, sampler=self._sampler)
         trace.set_tracer_provider(tracer_provider)
+        # Spans go through BatchSpanProcessor unless a factory was supplied;
+        # low-volume scenarios (e.g. console export in samples) can pass
+        # SimpleSpanProcessor to skip the background thread and queue.
+        span_processor_factory = self._span_processor_factory or BatchSpanProcessor
         should_add_console_exporter = True
         for exporter in exporters:
             if isinstance(exporter, SpanExporter):
-                tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+                tracer_provider.add_span_processor(span_processor_factory(exporter))
                 should_add_console_exporter = False
         if should_add_console_exporter:
             from opentelemetry.sdk.trace.export import ConsoleSpanExporter
 
-            tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+            tracer_provider.add_span_processor(span_processor_factory(ConsoleSpanExporter()))
 
         # Logging
         logger_provider = LoggerProvider(resource=self.resource)
@@ -662,6 +671,8 @@ def setup_observability(
     credential: "TokenCredential | None" = None,
     exporters: list["LogExporter | SpanExporter | MetricExporter"] | None = None,
     vs_code_extension_port: int | None = None,
+    sampler: "Sampler | None" = None,
+    span_processor_factory: "Callable[[SpanExporter], SpanProcessor] | None" = None,
 ) -> None:
     """Setup observability for the application with OpenTelemetry.
 
@@ -692,6 +703,14 @@ def setup_observability(
             extensions are listening on. When set, additional OTEL exporters will be
             created with endpoint `http://localhost:{vs_code_extension_port}` unless
             already configured. Overrides the environment variable if set. Default is None.
+        sampler: A sampler for the tracer provider, e.g.
+            ``ParentBased(TraceIdRatioBased(0.1))`` to retain a fraction of traces.
+            When None, the SDK's OTEL_TRACES_SAMPLER / OTEL_TRACES_SAMPLER_ARG
+            environment variables apply. Default is None.
+        span_processor_factory: Wraps each span exporter in a processor.
+            Defaults to ``BatchSpanProcessor``; pass ``SimpleSpanProcessor``
+            for low-volume scenarios where the batching thread and queue are
+            unnecessary overhead. Default is None.
 
     Examples:
         .. code-block:: python
@@ -740,6 +759,10 @@ def setup_observability(
         OBSERVABILITY_SETTINGS.enable_sensitive_data = enable_sensitive_data
     if vs_code_extension_port is not None:
         OBSERVABILITY_SETTINGS.vs_code_extension_port = vs_code_extension_port
+    if sampler is not None:
+        OBSERVABILITY_SETTINGS._sampler = sampler  # pyright: ignore[reportPrivateUsage]
+    if span_processor_factory is not None:
+        OBSERVABILITY_SETTINGS._span_processor_factory = span_processor_factory  # pyright: ignore[reportPrivateUsage]
 
     # Create exporters, after checking if they are already configured through the env.
     new_exporters: list["LogExporter | SpanExporter | MetricExporter"] = exporters or []
@@ -1554,12 +1577,45 @@ def workflow_tracer() -> "Tracer":
     return get_tracer() if OBSERVABILITY_SETTINGS.ENABLED else trace.NoOpTracer()
 
 
+def _sampler_respects_parent() -> bool:
+    """True when the active sampler follows the parent span's sampling decision.
+
+    Only the SDK's ParentBased samplers (including the ``parentbased_*``
+    defaults resolved from ``OTEL_TRACES_SAMPLER``) are guaranteed to drop
+    children of an unsampled parent. Samplers such as ``always_on`` or a bare
+    ``TraceIdRatioBased`` may still record them, so the short-circuit below
+    must not apply. When no SDK tracer provider is configured there is no
+    sampler to inspect and we conservatively return False.
+    """
+    sampler = getattr(trace.get_tracer_provider(), "sampler", None)
+    if sampler is None:
+        return False
+    from opentelemetry.sdk.trace.sampling import ParentBased
+
+    return isinstance(sampler, ParentBased)
+
+
+def _trace_sampled_out() -> bool:
+    """True when the current trace was head-sampled out and will stay that way.
+
+    Children of an unsampled parent can never be recorded under a
+    parent-respecting sampler, so callers can skip span creation entirely
+    instead of allocating a non-recording span, its context and attribute
+    dicts per operation. With a sampler that ignores the parent decision this
+    returns False and span creation proceeds as before.
+    """
+    parent_context = trace.get_current_span().get_span_context()
+    return parent_context.is_valid and not parent_context.trace_flags.sampled and _sampler_respects_parent()
+
+
 def create_workflow_span(
     name: str,
     attributes: Mapping[str, str | int] | None = None,
     kind: trace.SpanKind = trace.SpanKind.INTERNAL,
 ) -> "_AgnosticContextManager[trace.Span]":
     """Create a generic workflow span."""
+    if _trace_sampled_out():
+        return contextlib.nullcontext(trace.INVALID_SPAN)  # type: ignore[return-value]
     return workflow_tracer().start_as_current_span(name, kind=kind, attributes=attributes)
 
 
@@ -1569,13 +1625,21 @@ def create_processing_span(
     message_type: str,
     source_trace_contexts: list[dict[str, str]] | None = None,
     source_span_ids: list[str] | None = None,
+    base_attributes: Mapping[str, str] | None = None,
 ) -> "_AgnosticContextManager[trace.Span]":
     """Create an executor processing span with optional links to source spans.
 
     Processing spans are created as children of the current workflow span and
     linked (not nested) to the source publishing spans for causality tracking.
     This supports multiple links for fan-in scenarios.
+
+    base_attributes, when given, is a precomputed mapping of the static
+    executor attributes (id and type) built once per executor instead of per
+    message; only the message type is added per call.
     """
+    if _trace_sampled_out():
+        return contextlib.nullcontext(trace.INVALID_SPAN)  # type: ignore[return-value]
+
     # Create links to source spans for causality without nesting
     links: list[trace.Link] = []
     if source_trace_contexts and source_span_ids:
@@ -1601,14 +1665,18 @@ def create_processing_span(
                         )
                         links.append(trace.Link(span_context))
 
-    return workflow_tracer().start_as_current_span(
-        OtelAttr.EXECUTOR_PROCESS_SPAN,
-        kind=trace.SpanKind.INTERNAL,
-        attributes={
+    if base_attributes is not None:
+        attributes = {**base_attributes, OtelAttr.MESSAGE_TYPE: message_type}
+    else:
+        attributes = {
             OtelAttr.EXECUTOR_ID: executor_id,
             OtelAttr.EXECUTOR_TYPE: executor_type,
             OtelAttr.MESSAGE_TYPE: message_type,
-        },
+        }
+    return workflow_tracer().start_as_current_span(
+        OtelAttr.EXECUTOR_PROCESS_SPAN,
+        kind=trace.SpanKind.INTERNAL,
+        attributes=attributes,
         links=links,
     )
 
@@ -1635,6 +1703,9 @@ def create_edge_group_processing_span(
         source_trace_contexts: Optional trace contexts from source spans for linking.
         source_span_ids: Optional source span IDs for linking.
     """
+    if _trace_sampled_out():
+        return contextlib.nullcontext(trace.INVALID_SPAN)  # type: ignore[return-value]
+
     attributes: dict[str, str] = {
         OtelAttr.EDGE_GROUP_TYPE: edge_group_type,
     }
@@ -41,7 +41,7 @@ from .._types import (
 )
 from ..exceptions import ServiceInitializationError
 from ..observability import use_observability
-from ._shared import OpenAIConfigMixin, OpenAISettings
+from ._shared import OpenAIConfigMixin, OpenAISettings, _json_dumps
 
 if sys.version_info >= (3, 11):
     from typing import Self  # pragma: no cover
@@ -362,7 +362,7 @@ class OpenAIAssistantsClient(OpenAIConfigMixin, BaseChatClient):
 
         if event_data.required_action is not None:
             for tool_call in event_data.required_action.submit_tool_outputs.tool_calls:
-                call_id = json.dumps([response_id, tool_call.id])
+                call_id = _json_dumps([response_id, tool_call.id])
                 function_name = tool_call.function.name
                 function_arguments = json.loads(tool_call.function.arguments)
                 contents.append(FunctionCallContent(call_id=call_id, name=function_name, arguments=function_arguments))
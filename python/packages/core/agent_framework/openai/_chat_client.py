@@ -1,6 +1,5 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import json
 import sys
 from collections.abc import AsyncIterable, Awaitable, Callable, Mapping, MutableMapping, MutableSequence, Sequence
 from datetime import datetime
@@ -44,7 +43,7 @@ from ..exceptions import (
 )
 from ..observability import use_observability
 from ._exceptions import OpenAIContentFilterException
-from ._shared import OpenAIBase, OpenAIConfigMixin, OpenAISettings
+from ._shared import OpenAIBase, OpenAIConfigMixin, OpenAISettings, _json_dumps
 
 if sys.version_info >= (3, 12):
     from typing import override  # type: ignore # pragma: no cover
@@ -381,7 +380,7 @@ class OpenAIBaseChatClient(OpenAIBase, BaseChatClient):
         """Parse contents into the openai format."""
         match content:
             case FunctionCallContent():
-                args = json.dumps(content.arguments) if isinstance(content.arguments, Mapping) else content.arguments
+                args = _json_dumps(content.arguments) if isinstance(content.arguments, Mapping) else content.arguments
                 return {
                     "id": content.call_id,
                     "type": "function",
@@ -392,52 +391,53 @@ class OpenAIBaseChatClient(OpenAIBase, BaseChatClient):
                     "tool_call_id": content.call_id,
                     "content": content.result,
                 }
-            case DataContent() | UriContent() if content.has_top_level_media_type("image"):
-                return {
-                    "type": "image_url",
-                    "image_url": {"url": content.uri},
-                }
-            case DataContent() | UriContent() if content.has_top_level_media_type("audio"):
-                if content.media_type and "wav" in content.media_type:
-                    audio_format = "wav"
-                elif content.media_type and "mp3" in content.media_type:
-                    audio_format = "mp3"
-                else:
-                    # Fallback to default to_dict for unsupported audio formats
-                    return content.to_dict(exclude_none=True)
-
-                # Extract base64 data from data URI
-                audio_data = content.uri
-                if audio_data.startswith("data:"):
-                    # Extract just the base64 part after "data:audio/format;base64,"
-                    audio_data = audio_data.split(",", 1)[-1]
-
-                return {
-                    "type": "input_audio",
-                    "input_audio": {
-                        "data": audio_data,
-                        "format": audio_format,
-                    },
-                }
-            case DataContent() | UriContent() if content.media_type and content.media_type.startswith("application/"):
-                if content.media_type == "application/pdf":
-                    if content.uri.startswith("data:"):
-                        filename = (
-                            getattr(content, "filename", None)
-                            or content.additional_properties.get("filename", "document.pdf")
-                            if hasattr(content, "additional_properties") and content.additional_properties
-                            else "document.pdf"
-                        )
-                        return {
-                            "type": "file",
-                            "file": {
-                                "file_data": content.uri,  # Send full data URI
-                                "filename": filename,
-                            },
-                        }
-
-                    return content.to_dict(exclude_none=True)
-
+            case DataContent() | UriContent():
+                # Classify the top-level media type once instead of re-splitting
+                # it in a guard per case; image content dominates multimodal
+                # requests and is checked first.
+                media_type = content.media_type or ""
+                top_level = media_type.partition("/")[0].strip().lower()
+                if top_level == "image":
+                    return {
+                        "type": "image_url",
+                        "image_url": {"url": content.uri},
+                    }
+                if top_level == "audio":
+                    if "wav" in media_type:
+                        audio_format = "wav"
+                    elif "mp3" in media_type:
+                        audio_format = "mp3"
+                    else:
+                        # Fallback to default to_dict for unsupported audio formats
+                        return content.to_dict(exclude_none=True)
+
+                    # Extract base64 data from data URI
+                    audio_data = content.uri
+                    if audio_data.startswith("data:"):
+                        # Extract just the base64 part after "data:audio/format;base64,"
+                        audio_data = audio_data.split(",", 1)[-1]
+
+                    return {
+                        "type": "input_audio",
+                        "input_audio": {
+                            "data": audio_data,
+                            "format": audio_format,
+                        },
+                    }
+                if media_type == "application/pdf" and content.uri.startswith("data:"):
+                    filename = (
+                        getattr(content, "filename", None)
+                        or content.additional_properties.get("filename", "document.pdf")
+                        if hasattr(content, "additional_properties") and content.additional_properties
+                        else "document.pdf"
+                    )
+                    return {
+                        "type": "file",
+                        "file": {
+                            "file_data": content.uri,  # Send full data URI
+                            "filename": filename,
+                        },
+                    }
                 return content.to_dict(exclude_none=True)
             case _:
                 return content.to_dict(exclude_none=True)
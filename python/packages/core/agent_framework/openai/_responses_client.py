@@ -428,7 +428,9 @@ class OpenAIBaseResponsesClient(OpenAIBase, BaseChatClient):
                         ret["encrypted_content"] = encrypted_content
                 return ret
             case DataContent() | UriContent():
-                if content.has_top_level_media_type("image"):
+                # Classify the top-level media type once for both branches.
+                top_level = (content.media_type or "").partition("/")[0].strip().lower()
+                if top_level == "image":
                     return {
                         "type": "input_image",
                         "image_url": content.uri,
@@ -439,7 +441,7 @@ class OpenAIBaseResponsesClient(OpenAIBase, BaseChatClient):
                         if content.additional_properties
                         else None,
                     }
-                if content.has_top_level_media_type("audio"):
+                if top_level == "audio":
                     if content.media_type and "wav" in content.media_type:
                         format = "wav"
                     elif content.media_type and "mp3" in content.media_type:
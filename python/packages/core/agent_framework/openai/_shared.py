@@ -46,6 +46,21 @@ RESPONSE_TYPE = Union[
 OPTION_TYPE = Union[ChatOptions, dict[str, Any]]
 
 
+# Prefer orjson's C encoder for request-path payload serialization when it is
+# installed; fall back to stdlib json so it stays an optional dependency.
+try:
+    import orjson as _orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return _orjson.dumps(obj).decode()
+
+except ImportError:
+    import json as _json
+
+    def _json_dumps(obj: Any) -> str:
+        return _json.dumps(obj)
+
+
 __all__ = [
     "OpenAISettings",
 ]
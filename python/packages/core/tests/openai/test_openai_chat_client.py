@@ -1,7 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import os
-from typing import Annotated
+from typing import Annotated, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -37,6 +37,17 @@ skip_if_openai_integration_tests_disabled = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(scope="module")
+def parser_client() -> OpenAIChatClient:
+    """Shared client for parser-only tests.
+
+    The message/content parsers are pure functions of their arguments, so one
+    client instance can serve every parser test instead of paying client
+    construction per test.
+    """
+    return OpenAIChatClient(api_key="test-key", model_id="gpt-4o")
+
+
 def test_init(openai_unit_test_env: dict[str, str]) -> None:
     # Test successful initialization
     open_ai_chat_completion = OpenAIChatClient()
@@ -604,7 +615,7 @@ async def test_exception_message_includes_original_error_details() -> None:
     assert original_error_message in exception_message
 
 
-def test_chat_response_content_order_text_before_tool_calls(openai_unit_test_env: dict[str, str]):
+def test_chat_response_content_order_text_before_tool_calls(parser_client: OpenAIChatClient):
     """Test that text content appears before tool calls in ChatResponse contents."""
     # Import locally to avoid break other tests when the import changes
     from openai.types.chat.chat_completion import ChatCompletion, Choice
@@ -636,8 +647,7 @@ def test_chat_response_content_order_text_before_tool_calls(openai_unit_test_env
         ],
     )
 
-    client = OpenAIChatClient()
-    response = client._create_chat_response(mock_response, ChatOptions())
+    response = parser_client._create_chat_response(mock_response, ChatOptions())
 
     # Verify we have both text and tool call content
     assert len(response.messages) == 1
@@ -651,14 +661,13 @@ def test_chat_response_content_order_text_before_tool_calls(openai_unit_test_env
     assert message.contents[1].name == "calculate"
 
 
-def test_function_result_falsy_values_handling(openai_unit_test_env: dict[str, str]):
+def test_function_result_falsy_values_handling(parser_client: OpenAIChatClient):
     """Test that falsy values (like empty list) in function result are properly handled."""
-    client = OpenAIChatClient()
 
     # Test with empty list (falsy but not None)
     message_with_empty_list = ChatMessage(role="tool", contents=[FunctionResultContent(call_id="call-123", result=[])])
 
-    openai_messages = client._openai_chat_message_parser(message_with_empty_list)
+    openai_messages = parser_client._openai_chat_message_parser(message_with_empty_list)
     assert len(openai_messages) == 1
     assert openai_messages[0]["content"] == "[]"  # Empty list should be JSON serialized
 
@@ -667,24 +676,23 @@ def test_function_result_falsy_values_handling(openai_unit_test_env: dict[str, s
         role="tool", contents=[FunctionResultContent(call_id="call-456", result="")]
     )
 
-    openai_messages = client._openai_chat_message_parser(message_with_empty_string)
+    openai_messages = parser_client._openai_chat_message_parser(message_with_empty_string)
     assert len(openai_messages) == 1
     assert openai_messages[0]["content"] == ""  # Empty string should be preserved
 
     # Test with False (falsy but not None)
     message_with_false = ChatMessage(role="tool", contents=[FunctionResultContent(call_id="call-789", result=False)])
 
-    openai_messages = client._openai_chat_message_parser(message_with_false)
+    openai_messages = parser_client._openai_chat_message_parser(message_with_false)
     assert len(openai_messages) == 1
     assert openai_messages[0]["content"] == "false"  # False should be JSON serialized
 
 
-def test_function_result_exception_handling(openai_unit_test_env: dict[str, str]):
+def test_function_result_exception_handling(parser_client: OpenAIChatClient):
     """Test that exceptions in function result are properly handled.
 
     Feel free to remove this test in case there's another new behavior.
     """
-    client = OpenAIChatClient()
 
     # Test with exception (no result)
     test_exception = ValueError("Test error message")
@@ -692,7 +700,7 @@ def test_function_result_exception_handling(openai_unit_test_env: dict[str, str]
         role="tool", contents=[FunctionResultContent(call_id="call-123", exception=test_exception)]
     )
 
-    openai_messages = client._openai_chat_message_parser(message_with_exception)
+    openai_messages = parser_client._openai_chat_message_parser(message_with_exception)
     assert len(openai_messages) == 1
     assert openai_messages[0]["content"] == "Error: Test error message"
     assert openai_messages[0]["tool_call_id"] == "call-123"
@@ -705,9 +713,8 @@ def test_prepare_function_call_results_string_passthrough():
     assert isinstance(result, str)
 
 
-def test_openai_content_parser_data_content_image(openai_unit_test_env: dict[str, str]) -> None:
+def test_openai_content_parser_data_content_image(parser_client: OpenAIChatClient) -> None:
     """Test _openai_content_parser converts DataContent with image media type to OpenAI format."""
-    client = OpenAIChatClient()
 
     # Test DataContent with image media type
     image_data_content = DataContent(
@@ -715,7 +722,7 @@ def test_openai_content_parser_data_content_image(openai_unit_test_env: dict[str
         media_type="image/png",
     )
 
-    result = client._openai_content_parser(image_data_content)  # type: ignore
+    result = parser_client._openai_content_parser(image_data_content)  # type: ignore
 
     # Should convert to OpenAI image_url format
     assert result["type"] == "image_url"
@@ -724,7 +731,7 @@ def test_openai_content_parser_data_content_image(openai_unit_test_env: dict[str
     # Test DataContent with non-image media type should use default model_dump
     text_data_content = DataContent(uri="data:text/plain;base64,SGVsbG8gV29ybGQ=", media_type="text/plain")
 
-    result = client._openai_content_parser(text_data_content)  # type: ignore
+    result = parser_client._openai_content_parser(text_data_content)  # type: ignore
 
     # Should use default model_dump format
     assert result["type"] == "data"
@@ -737,7 +744,7 @@ def test_openai_content_parser_data_content_image(openai_unit_test_env: dict[str
         media_type="audio/wav",
     )
 
-    result = client._openai_content_parser(audio_data_content)  # type: ignore
+    result = parser_client._openai_content_parser(audio_data_content)  # type: ignore
 
     # Should convert to OpenAI input_audio format
     assert result["type"] == "input_audio"
@@ -748,7 +755,7 @@ def test_openai_content_parser_data_content_image(openai_unit_test_env: dict[str
     # Test DataContent with MP3 audio
     mp3_data_content = DataContent(uri="data:audio/mp3;base64,//uQAAAAWGluZwAAAA8AAAACAAACcQ==", media_type="audio/mp3")
 
-    result = client._openai_content_parser(mp3_data_content)  # type: ignore
+    result = parser_client._openai_content_parser(mp3_data_content)  # type: ignore
 
     # Should convert to OpenAI input_audio format with mp3
     assert result["type"] == "input_audio"
@@ -762,7 +769,7 @@ def test_openai_content_parser_data_content_image(openai_unit_test_env: dict[str
         media_type="application/pdf",
     )
 
-    result = client._openai_content_parser(pdf_data_content)  # type: ignore
+    result = parser_client._openai_content_parser(pdf_data_content)  # type: ignore
 
     # Should convert to OpenAI file format
     assert result["type"] == "file"
@@ -778,13 +785,32 @@ def test_openai_content_parser_data_content_image(openai_unit_test_env: dict[str
         additional_properties={"filename": "report.pdf"},
     )
 
-    result = client._openai_content_parser(pdf_with_filename)  # type: ignore
+    result = parser_client._openai_content_parser(pdf_with_filename)  # type: ignore
 
     # Should use custom filename
     assert result["type"] == "file"
     assert result["file"]["filename"] == "report.pdf"
 
 
+# Built once at collection so each parametrize case reuses the same content
+# object and expected dict instead of re-validating a fresh model per case.
+_IMAGE_FORMAT_CASES = [
+    (
+        DataContent(uri=f"data:{media_type};base64,iVBORw0KGgo=", media_type=media_type),
+        {"type": "image_url", "image_url": {"url": f"data:{media_type};base64,iVBORw0KGgo="}},
+    )
+    for media_type in ("image/png", "image/jpeg", "image/gif", "image/webp", "image/bmp", "image/tiff")
+]
+
+
+@pytest.mark.parametrize("content,expected", _IMAGE_FORMAT_CASES)
+def test_openai_content_parser_image_formats(
+    parser_client: OpenAIChatClient, content: DataContent, expected: dict[str, Any]
+) -> None:
+    """Every image media type maps to the OpenAI image_url format."""
+    assert parser_client._openai_content_parser(content) == expected  # type: ignore
+
+
 def test_openai_chat_client_with_callable_api_key() -> None:
     """Test OpenAIChatClient initialization with callable API key."""
 
@@ -111,6 +111,58 @@ async def test_workflow_run_streaming() -> None:
     assert result is not None and result == 10
 
 
+async def test_workflow_run_stream_event_filter() -> None:
+    """Test that run_stream with an event filter yields only matching events."""
+    executor_a = IncrementExecutor(id="executor_a")
+    executor_b = IncrementExecutor(id="executor_b")
+
+    workflow = (
+        WorkflowBuilder()
+        .set_start_executor(executor_a)
+        .add_edge(executor_a, executor_b)
+        .add_edge(executor_b, executor_a)
+        .build()
+    )
+
+    events = [event async for event in workflow.run_stream(NumberMessage(data=0), event_filter=WorkflowOutputEvent)]
+
+    # The workflow still ran to completion; only the output event reached the caller.
+    assert len(events) == 1
+    assert isinstance(events[0], WorkflowOutputEvent)
+    assert events[0].data == 10
+
+
+async def test_workflow_run_stream_event_filter_tuple() -> None:
+    """Test that run_stream accepts a tuple of event types as filter."""
+    executor_a = IncrementExecutor(id="executor_a")
+    executor_b = IncrementExecutor(id="executor_b")
+
+    workflow = (
+        WorkflowBuilder()
+        .set_start_executor(executor_a)
+        .add_edge(executor_a, executor_b)
+        .add_edge(executor_b, executor_a)
+        .build()
+    )
+
+    events = [
+        event
+        async for event in workflow.run_stream(
+            NumberMessage(data=0), event_filter=(WorkflowOutputEvent, WorkflowStatusEvent)
+        )
+    ]
+
+    assert events and all(isinstance(event, (WorkflowOutputEvent, WorkflowStatusEvent)) for event in events)
+
+    output_events = [event for event in events if isinstance(event, WorkflowOutputEvent)]
+    assert len(output_events) == 1
+    assert output_events[0].data == 10
+
+    status_states = [event.state for event in events if isinstance(event, WorkflowStatusEvent)]
+    assert WorkflowRunState.IN_PROGRESS in status_states
+    assert WorkflowRunState.IDLE in status_states
+
+
 async def test_workflow_run_stream_not_completed():
     """Test the workflow run stream."""
     executor_a = IncrementExecutor(id="executor_a")
@@ -489,3 +489,113 @@ async def test_workflow_build_error_tracing(span_exporter: InMemorySpanExporter)
     assert error_event.attributes is not None
     assert "Starting executor must be set" in str(error_event.attributes.get("build.error.message"))
     assert error_event.attributes.get("build.error.type") == "ValueError"
+
+
+async def test_sampler_respects_parent_detection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the unsampled-parent short-circuit only applies to parent-based samplers."""
+    from opentelemetry.sdk.trace.sampling import ALWAYS_ON, ParentBased
+
+    import agent_framework.observability as observability
+
+    class FakeProvider:
+        def __init__(self, sampler: Any = None) -> None:
+            if sampler is not None:
+                self.sampler = sampler
+
+    # Parent-based samplers always drop children of an unsampled parent.
+    monkeypatch.setattr(observability.trace, "get_tracer_provider", lambda: FakeProvider(ParentBased(ALWAYS_ON)))
+    assert observability._sampler_respects_parent()  # pyright: ignore[reportPrivateUsage]
+
+    # Samplers that ignore the parent decision may still record such children.
+    monkeypatch.setattr(observability.trace, "get_tracer_provider", lambda: FakeProvider(ALWAYS_ON))
+    assert not observability._sampler_respects_parent()  # pyright: ignore[reportPrivateUsage]
+
+    # No SDK provider configured means there is no sampler to inspect.
+    monkeypatch.setattr(observability.trace, "get_tracer_provider", lambda: FakeProvider())
+    assert not observability._sampler_respects_parent()  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_unsampled_parent_skips_span_creation(span_exporter: InMemorySpanExporter) -> None:
+    """Test that span creation is skipped entirely under an unsampled parent with the default sampler."""
+    from opentelemetry import context as otel_context
+
+    # The default sampler (parentbased_always_on) respects the parent decision,
+    # so an unsampled incoming context must short-circuit to INVALID_SPAN
+    # instead of allocating a non-recording span.
+    unsampled_parent = trace.NonRecordingSpan(
+        trace.SpanContext(
+            trace_id=0x12345678901234567890123456789012,
+            span_id=0x1234567890123456,
+            is_remote=True,
+            trace_flags=trace.TraceFlags(0),
+        )
+    )
+    token = otel_context.attach(trace.set_span_in_context(unsampled_parent))
+    try:
+        with create_workflow_span(OtelAttr.WORKFLOW_RUN_SPAN, {OtelAttr.WORKFLOW_ID: "wf"}) as span:
+            assert span is trace.INVALID_SPAN
+        with create_processing_span("executor-1", "TestExecutor", "TestMessage") as span:
+            assert span is trace.INVALID_SPAN
+    finally:
+        otel_context.detach(token)
+
+    assert len(span_exporter.get_finished_spans()) == 0
+
+
+async def test_configure_providers_uses_supplied_sampler(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the sampler passed to setup_observability is carried by the tracer provider."""
+    from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
+
+    import agent_framework.observability as observability
+
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr(observability.trace, "set_tracer_provider", lambda p: captured.setdefault("provider", p))
+
+    sampler = TraceIdRatioBased(0.0)
+    settings = observability.ObservabilitySettings(enable_otel=True, env_file_path="test.env")
+    settings._sampler = sampler  # pyright: ignore[reportPrivateUsage]
+    exporter = InMemorySpanExporter()
+    settings._configure_providers([exporter])  # pyright: ignore[reportPrivateUsage]
+
+    provider = captured["provider"]
+    assert provider.sampler is sampler
+
+    # A ratio of 0 samples nothing, so no spans reach the exporter.
+    with provider.get_tracer("test").start_as_current_span("dropped"):
+        pass
+    provider.force_flush()
+    assert len(exporter.get_finished_spans()) == 0
+
+
+async def test_configure_providers_span_processor_factory(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that span_processor_factory replaces BatchSpanProcessor for every exporter."""
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+    import agent_framework.observability as observability
+
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr(observability.trace, "set_tracer_provider", lambda p: captured.setdefault("provider", p))
+
+    settings = observability.ObservabilitySettings(enable_otel=True, env_file_path="test.env")
+    settings._span_processor_factory = SimpleSpanProcessor  # pyright: ignore[reportPrivateUsage]
+    exporter = InMemorySpanExporter()
+    settings._configure_providers([exporter])  # pyright: ignore[reportPrivateUsage]
+
+    provider = captured["provider"]
+    processors = provider._active_span_processor._span_processors
+    assert processors and all(isinstance(p, SimpleSpanProcessor) for p in processors)
+
+    # Simple processing exports synchronously on span end, without a flush.
+    with provider.get_tracer("test").start_as_current_span("sync"):
+        pass
+    assert len(exporter.get_finished_spans()) == 1
+
+    # The console-exporter fallback branch honors the factory as well.
+    captured.clear()
+    fallback_settings = observability.ObservabilitySettings(enable_otel=True, env_file_path="test.env")
+    fallback_settings._span_processor_factory = SimpleSpanProcessor  # pyright: ignore[reportPrivateUsage]
+    fallback_settings._configure_providers([])  # pyright: ignore[reportPrivateUsage]
+
+    fallback_provider = captured["provider"]
+    fallback_processors = fallback_provider._active_span_processor._span_processors
+    assert fallback_processors and all(isinstance(p, SimpleSpanProcessor) for p in fallback_processors)
@@ -2,12 +2,17 @@
 
 """Agent Framework message mapper implementation."""
 
+import io
+import itertools
 import json
 import logging
-import uuid
-from collections.abc import Sequence
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Union
+from typing import Any, ClassVar, Union
 
 from .models import (
     AgentFrameworkRequest,
@@ -22,6 +27,7 @@ from .models import (
     ResponseReasoningTextDeltaEvent,
     ResponseStreamEvent,
     ResponseTextDeltaEvent,
+    ResponseTraceEvent,
     ResponseTraceEventComplete,
     ResponseUsage,
     ResponseUsageEventComplete,
@@ -30,6 +36,63 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Import Agent Framework types once at module load; every event used to pay for
+# re-running the import machinery inside the hot conversion methods.
+try:
+    from agent_framework import AgentRunResponseUpdate, TextContent, WorkflowEvent
+    from agent_framework._workflows._events import AgentRunUpdateEvent
+
+    _AGENT_FRAMEWORK_AVAILABLE = True
+except ImportError as e:  # pragma: no cover - exercised only without agent-framework-core
+    logger.warning(f"Could not import Agent Framework types: {e}")
+    _AGENT_FRAMEWORK_AVAILABLE = False
+
+# Prefer orjson (C implementation) for serializing content payloads when it is
+# installed; fall back to stdlib json so it stays an optional dependency.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+
+# Event type literals, interned and bound once at module level so hot-path
+# comparisons and event construction reuse a single string object instead of
+# re-materializing the literal per event.
+_TYPE_ERROR = sys.intern("error")
+_TEXT_DELTA_TYPE = sys.intern("response.output_text.delta")
+_REASONING_DELTA_TYPE = sys.intern("response.reasoning_text.delta")
+_FUNCTION_ARGS_DELTA_TYPE = sys.intern("response.function_call_arguments.delta")
+_FUNCTION_RESULT_TYPE = sys.intern("response.function_result.complete")
+_TRACE_COMPLETE_TYPE = sys.intern("response.trace.complete")
+_USAGE_COMPLETE_TYPE = sys.intern("response.usage.complete")
+_WORKFLOW_EVENT_TYPE = sys.intern("response.workflow_event.complete")
+_APPROVAL_REQUESTED_TYPE = sys.intern("response.function_approval.requested")
+_APPROVAL_RESPONDED_TYPE = sys.intern("response.function_approval.responded")
+
+# Upper bound on retained per-request conversion contexts. Eviction uses plain
+# dict insertion order (oldest first) - no OrderedDict bookkeeping on the per
+# event lookup path.
+_MAX_CONTEXTS = 256
+
+# Shared zero-valued usage models: identical for every response and never
+# mutated after construction, so one instance serves all responses instead of
+# rebuilding the same Pydantic objects per request.
+_ZERO_INPUT_TOKENS_DETAILS = InputTokensDetails(cached_tokens=0)
+_ZERO_OUTPUT_TOKENS_DETAILS = OutputTokensDetails(reasoning_tokens=0)
+_ZERO_USAGE = ResponseUsage(
+    input_tokens=0,
+    output_tokens=0,
+    total_tokens=0,
+    input_tokens_details=_ZERO_INPUT_TOKENS_DETAILS,
+    output_tokens_details=_ZERO_OUTPUT_TOKENS_DETAILS,
+)
+
 # Type alias for all possible event types
 EventType = Union[
     ResponseStreamEvent,
@@ -40,29 +103,90 @@ EventType = Union[
 ]
 
 
+@dataclass(slots=True)
+class ConversionContext:
+    """Per-request conversion state threaded through the event handlers.
+
+    A slotted struct instead of a dict: hot-path handlers read item_id and the
+    index fields on every event, and slot access skips the string hash+probe.
+    """
+
+    item_id: str
+    content_index: int = 0
+    output_index: int = 0
+    usage_data: list[Any] = field(default_factory=list)
+    seq: Iterator[int] = field(default_factory=lambda: itertools.count(1))
+    # Memoized ISO timestamp shared by sub-events (see MessageMapper._now_iso)
+    now_iso: str = ""
+    now_monotonic: float = 0.0
+    # Prebuilt ResponseTextDeltaEvent reused via model_copy for every text delta
+    text_delta_template: Any = None
+
+
 class MessageMapper:
     """Maps Agent Framework messages/responses to OpenAI format."""
 
-    def __init__(self) -> None:
-        """Initialize Agent Framework message mapper."""
+    # Content type -> mapper method name for all 12 Agent Framework content
+    # types. Frozen at class level; instances bind the methods once in __init__.
+    _CONTENT_MAPPERS: ClassVar[dict[str, str]] = {
+        "TextContent": "_map_text_content",
+        "TextReasoningContent": "_map_reasoning_content",
+        "FunctionCallContent": "_map_function_call_content",
+        "FunctionResultContent": "_map_function_result_content",
+        "ErrorContent": "_map_error_content",
+        "UsageContent": "_map_usage_content",
+        "DataContent": "_map_data_content",
+        "UriContent": "_map_uri_content",
+        "HostedFileContent": "_map_hosted_file_content",
+        "HostedVectorStoreContent": "_map_hosted_vector_store_content",
+        "FunctionApprovalRequestContent": "_map_approval_request_content",
+        "FunctionApprovalResponseContent": "_map_approval_response_content",
+    }
+
+    def __init__(self, trace_enabled: bool = True) -> None:
+        """Initialize Agent Framework message mapper.
+
+        Args:
+            trace_enabled: When False, informational trace events (collector
+                traces plus data/uri/hosted-content notifications) are skipped
+                entirely instead of being built and discarded downstream.
+        """
+        self.trace_enabled = trace_enabled
         self.sequence_counter = 0
-        self._conversion_contexts: dict[int, dict[str, Any]] = {}
-
-        # Register content type mappers for all 12 Agent Framework content types
-        self.content_mappers = {
-            "TextContent": self._map_text_content,
-            "TextReasoningContent": self._map_reasoning_content,
-            "FunctionCallContent": self._map_function_call_content,
-            "FunctionResultContent": self._map_function_result_content,
-            "ErrorContent": self._map_error_content,
-            "UsageContent": self._map_usage_content,
-            "DataContent": self._map_data_content,
-            "UriContent": self._map_uri_content,
-            "HostedFileContent": self._map_hosted_file_content,
-            "HostedVectorStoreContent": self._map_hosted_vector_store_content,
-            "FunctionApprovalRequestContent": self._map_approval_request_content,
-            "FunctionApprovalResponseContent": self._map_approval_response_content,
+        self._conversion_contexts: dict[int, ConversionContext] = {}
+
+        # Pooled randomness for short IDs: one os.urandom syscall yields many
+        # IDs, instead of a UUID object + RNG call per generated ID.
+        self._id_hex = ""
+        self._id_pos = 0
+
+        # Bound-method view of _CONTENT_MAPPERS for dispatch by class name
+        self.content_mappers = {name: getattr(self, method) for name, method in self._CONTENT_MAPPERS.items()}
+
+        # Class-keyed view of content_mappers, populated lazily on first sighting
+        # of each content class. The hot loop then dispatches on type(content)
+        # without materializing and hashing __class__.__name__ per content item.
+        # Mappers are plain functions: none of them awaits, so calling them
+        # directly skips a coroutine allocation per content item.
+        self._content_mapper_by_cls: dict[type, Callable[[Any, "ConversionContext"], Any] | None] = {}
+
+        # Event class -> handler table so convert_event does a single dict lookup
+        # per event instead of an isinstance cascade with in-method imports.
+        # Unknown subclasses (e.g. custom WorkflowEvents) are resolved via their
+        # MRO once and memoized back into the table.
+        self._event_dispatch: dict[type, Callable[[Any, "ConversionContext"], Awaitable[Sequence[Any]]]] = {
+            ResponseTraceEvent: self._convert_trace_event,
         }
+        # TextContent deltas dominate typical streams; cache the class so the
+        # content loop can branch straight to the text path without any dict hit.
+        self._text_content_cls: type | None = None
+        if _AGENT_FRAMEWORK_AVAILABLE:
+            # AgentRunUpdateEvent subclasses WorkflowEvent; registering it directly
+            # keeps the more specific handler ahead of the generic one in MRO order.
+            self._event_dispatch[AgentRunUpdateEvent] = self._convert_agent_update_event
+            self._event_dispatch[AgentRunResponseUpdate] = self._convert_agent_update
+            self._event_dispatch[WorkflowEvent] = self._convert_workflow_event
+            self._text_content_cls = TextContent
 
     async def convert_event(self, raw_event: Any, request: AgentFrameworkRequest) -> Sequence[Any]:
         """Convert a single Agent Framework event to OpenAI events.
@@ -77,54 +201,88 @@ class MessageMapper:
         context = self._get_or_create_context(request)
 
         # Handle error events
-        if isinstance(raw_event, dict) and raw_event.get("type") == "error":
-            return [await self._create_error_event(raw_event.get("message", "Unknown error"), context)]
-
-        # Handle ResponseTraceEvent objects from our trace collector
-        from .models import ResponseTraceEvent
-
-        if isinstance(raw_event, ResponseTraceEvent):
-            return [
-                ResponseTraceEventComplete(
-                    type="response.trace.complete",
-                    data=raw_event.data,
-                    item_id=context["item_id"],
-                    sequence_number=self._next_sequence(context),
-                )
-            ]
+        if isinstance(raw_event, dict):
+            if raw_event.get("type") == _TYPE_ERROR:
+                return (self._create_error_event(raw_event.get("message", "Unknown error"), context),)
+            return (self._create_unknown_event(raw_event, context),)
 
-        # Import Agent Framework types for proper isinstance checks
-        try:
-            from agent_framework import AgentRunResponseUpdate, WorkflowEvent
-            from agent_framework._workflows._events import AgentRunUpdateEvent
-
-            # Handle AgentRunUpdateEvent - workflow event wrapping AgentRunResponseUpdate
-            # This must be checked BEFORE generic WorkflowEvent check
-            if isinstance(raw_event, AgentRunUpdateEvent):
-                # Extract the AgentRunResponseUpdate from the event's data attribute
-                if raw_event.data and isinstance(raw_event.data, AgentRunResponseUpdate):
-                    return await self._convert_agent_update(raw_event.data, context)
-                # If no data, treat as generic workflow event
-                return await self._convert_workflow_event(raw_event, context)
-
-            # Handle agent updates (AgentRunResponseUpdate) - for direct agent execution
-            if isinstance(raw_event, AgentRunResponseUpdate):
-                return await self._convert_agent_update(raw_event, context)
-
-            # Handle workflow events (any class that inherits from WorkflowEvent)
-            if isinstance(raw_event, WorkflowEvent):
-                return await self._convert_workflow_event(raw_event, context)
-
-        except ImportError as e:
-            logger.warning(f"Could not import Agent Framework types: {e}")
-            # Fallback to attribute-based detection
-            if hasattr(raw_event, "contents"):
-                return await self._convert_agent_update(raw_event, context)
-            if hasattr(raw_event, "__class__") and "Event" in raw_event.__class__.__name__:
-                return await self._convert_workflow_event(raw_event, context)
+        event_cls = type(raw_event)
+        handler = self._event_dispatch.get(event_cls)
+        if handler is None:
+            handler = self._resolve_event_handler(event_cls)
+
+        if handler is not None:
+            return await handler(raw_event, context)
+
+        # Fallback to attribute-based detection (Agent Framework types unavailable)
+        if hasattr(raw_event, "contents"):
+            return await self._convert_agent_update(raw_event, context)
+        if "Event" in event_cls.__name__:
+            return await self._convert_workflow_event(raw_event, context)
 
         # Unknown event type
-        return [await self._create_unknown_event(raw_event, context)]
+        return (self._create_unknown_event(raw_event, context),)
+
+    def _resolve_event_handler(
+        self, event_cls: type
+    ) -> Callable[[Any, "ConversionContext"], Awaitable[Sequence[Any]]] | None:
+        """Resolve a handler for an unregistered event class via its MRO.
+
+        The result is memoized into the dispatch table so subsequent events of the
+        same class hit the single dict lookup in convert_event.
+
+        Args:
+            event_cls: Class of the raw event
+
+        Returns:
+            Matching handler, or None if no registered base class matches
+        """
+        handler = None
+        for base in event_cls.__mro__[1:]:
+            handler = self._event_dispatch.get(base)
+            if handler is not None:
+                break
+        if handler is not None:
+            self._event_dispatch[event_cls] = handler
+        return handler
+
+    async def _convert_trace_event(self, raw_event: Any, context: ConversionContext) -> Sequence[Any]:
+        """Convert ResponseTraceEvent from our trace collector to a complete trace event.
+
+        Args:
+            raw_event: ResponseTraceEvent instance
+            context: Conversion context
+
+        Returns:
+            List with the completed trace event
+        """
+        if not self.trace_enabled:
+            return ()
+        return (
+            ResponseTraceEventComplete.model_construct(
+                type=_TRACE_COMPLETE_TYPE,
+                data=raw_event.data,
+                item_id=context.item_id,
+                sequence_number=self._next_sequence(context),
+            ),
+        )
+
+    async def _convert_agent_update_event(self, event: Any, context: ConversionContext) -> Sequence[Any]:
+        """Convert AgentRunUpdateEvent - workflow event wrapping AgentRunResponseUpdate.
+
+        Args:
+            event: AgentRunUpdateEvent instance
+            context: Conversion context
+
+        Returns:
+            List of OpenAI response stream events
+        """
+        # Extract the AgentRunResponseUpdate from the event's data attribute
+        data = event.data
+        if data is not None and hasattr(data, "contents"):
+            return await self._convert_agent_update(data, context)
+        # If no data, treat as generic workflow event
+        return await self._convert_workflow_event(event, context)
 
     async def aggregate_to_response(self, events: Sequence[Any], request: AgentFrameworkRequest) -> OpenAIResponse:
         """Aggregate streaming events into final OpenAI response.
@@ -137,16 +295,18 @@ class MessageMapper:
             Final aggregated OpenAI response
         """
         try:
-            # Extract text content from events
-            content_parts = []
+            # Accumulate delta text in a single growing buffer instead of a list
+            # of small strings plus a join pass.
+            buf = io.StringIO()
 
             for event in events:
-                # Extract delta text from ResponseTextDeltaEvent
-                if hasattr(event, "delta") and hasattr(event, "type") and event.type == "response.output_text.delta":
-                    content_parts.append(event.delta)
+                # Exact-type check: text deltas are always constructed as concrete
+                # ResponseTextDeltaEvent instances, so this avoids per-event
+                # attribute probing on the many non-text events in the stream.
+                if type(event) is ResponseTextDeltaEvent:
+                    buf.write(event.delta)
 
-            # Combine content
-            full_content = "".join(content_parts)
+            full_content = buf.getvalue()
 
             # Create proper OpenAI Response
             response_output_text = ResponseOutputText(type="output_text", text=full_content, annotations=[])
@@ -155,26 +315,26 @@ class MessageMapper:
                 type="message",
                 role="assistant",
                 content=[response_output_text],
-                id=f"msg_{uuid.uuid4().hex[:8]}",
+                id=self._short_id("msg_"),
                 status="completed",
             )
 
             # Create usage object
-            input_token_count = len(str(request.input)) // 4 if request.input else 0
-            output_token_count = len(full_content) // 4
+            input_token_count = self._estimate_tokens(request.input) if request.input else 0
+            output_token_count = len(full_content) >> 2
 
             usage = ResponseUsage(
                 input_tokens=input_token_count,
                 output_tokens=output_token_count,
                 total_tokens=input_token_count + output_token_count,
-                input_tokens_details=InputTokensDetails(cached_tokens=0),
-                output_tokens_details=OutputTokensDetails(reasoning_tokens=0),
+                input_tokens_details=_ZERO_INPUT_TOKENS_DETAILS,
+                output_tokens_details=_ZERO_OUTPUT_TOKENS_DETAILS,
             )
 
             return OpenAIResponse(
-                id=f"resp_{uuid.uuid4().hex[:12]}",
+                id=self._short_id("resp_", 12),
                 object="response",
-                created_at=datetime.now().timestamp(),
+                created_at=time.time(),
                 model=request.model,
                 output=[response_output_message],
                 usage=usage,
@@ -187,26 +347,87 @@ class MessageMapper:
             logger.exception(f"Error aggregating response: {e}")
             return await self._create_error_response(str(e), request)
 
-    def _get_or_create_context(self, request: AgentFrameworkRequest) -> dict[str, Any]:
+    def _get_or_create_context(self, request: AgentFrameworkRequest) -> ConversionContext:
         """Get or create conversion context for this request.
 
         Args:
             request: Request to get context for
 
         Returns:
-            Conversion context dictionary
+            Conversion context
         """
         request_key = id(request)
-        if request_key not in self._conversion_contexts:
-            self._conversion_contexts[request_key] = {
-                "sequence_counter": 0,
-                "item_id": f"msg_{uuid.uuid4().hex[:8]}",
-                "content_index": 0,
-                "output_index": 0,
-            }
-        return self._conversion_contexts[request_key]
+        context = self._conversion_contexts.get(request_key)
+        if context is None:
+            if len(self._conversion_contexts) >= _MAX_CONTEXTS:
+                # Evict the oldest context; plain dicts preserve insertion order
+                del self._conversion_contexts[next(iter(self._conversion_contexts))]
+            context = self._conversion_contexts[request_key] = ConversionContext(item_id=self._short_id("msg_"))
+        return context
+
+    def _estimate_tokens(self, obj: Any) -> int:
+        """Estimate token count (~4 chars per token) for arbitrary request input.
+
+        Walks strings inside lists/dicts structurally instead of materializing
+        str(obj), so large multimodal inputs are measured in O(1) extra memory.
+
+        Args:
+            obj: Request input (string, list of input items, or dict)
+
+        Returns:
+            Estimated token count
+        """
+        return self._char_count(obj) >> 2
+
+    def _char_count(self, obj: Any) -> int:
+        """Sum the lengths of all string leaves in a nested structure."""
+        if isinstance(obj, str):
+            return len(obj)
+        if isinstance(obj, (list, tuple)):
+            return sum(self._char_count(item) for item in obj)
+        if isinstance(obj, dict):
+            return sum(self._char_count(value) for value in obj.values())
+        if obj is None:
+            return 0
+        return len(str(obj))
+
+    def _short_id(self, prefix: str, n: int = 8) -> str:
+        """Generate a short random hex ID, amortizing RNG syscalls via a pool.
+
+        Args:
+            prefix: ID prefix (e.g. "msg_")
+            n: Number of hex characters after the prefix
 
-    def _next_sequence(self, context: dict[str, Any]) -> int:
+        Returns:
+            Prefixed random ID string
+        """
+        if self._id_pos + n > len(self._id_hex):
+            self._id_hex = os.urandom(128).hex()
+            self._id_pos = 0
+        start = self._id_pos
+        self._id_pos = start + n
+        return f"{prefix}{self._id_hex[start : start + n]}"
+
+    def _now_iso(self, context: ConversionContext) -> str:
+        """Get an ISO timestamp, memoized per context with a 100ms TTL.
+
+        Event payload timestamps are informational; reusing one formatted
+        string across the sub-events of a burst avoids a clock read plus
+        strftime-style formatting per emitted event.
+
+        Args:
+            context: Conversion context
+
+        Returns:
+            ISO-formatted timestamp string
+        """
+        now = time.monotonic()
+        if not context.now_iso or now - context.now_monotonic > 0.1:
+            context.now_iso = datetime.now().isoformat()
+            context.now_monotonic = now
+        return context.now_iso
+
+    def _next_sequence(self, context: ConversionContext) -> int:
         """Get next sequence number for events.
 
         Args:
@@ -215,10 +436,9 @@ class MessageMapper:
         Returns:
             Next sequence number
         """
-        context["sequence_counter"] += 1
-        return int(context["sequence_counter"])
+        return next(context.seq)
 
-    async def _convert_agent_update(self, update: Any, context: dict[str, Any]) -> Sequence[Any]:
+    async def _convert_agent_update(self, update: Any, context: ConversionContext) -> Sequence[Any]:
         """Convert AgentRunResponseUpdate to OpenAI events using comprehensive content mapping.
 
         Args:
@@ -236,27 +456,39 @@ class MessageMapper:
                 return events
 
             for content in update.contents:
-                content_type = content.__class__.__name__
+                content_cls = type(content)
 
-                if content_type in self.content_mappers:
-                    mapped_events = await self.content_mappers[content_type](content, context)
+                # Fast path: text deltas are by far the most frequent content
+                if content_cls is self._text_content_cls:
+                    events.append(self._create_text_delta_event(content.text, context))
+                    context.content_index += 1
+                    continue
+
+                try:
+                    content_mapper = self._content_mapper_by_cls[content_cls]
+                except KeyError:
+                    content_mapper = self.content_mappers.get(content_cls.__name__)
+                    self._content_mapper_by_cls[content_cls] = content_mapper
+
+                if content_mapper is not None:
+                    mapped_events = content_mapper(content, context)
                     if isinstance(mapped_events, list):
                         events.extend(mapped_events)
                     else:
                         events.append(mapped_events)
                 else:
                     # Graceful fallback for unknown content types
-                    events.append(await self._create_unknown_content_event(content, context))
+                    events.append(self._create_unknown_content_event(content, context))
 
-                context["content_index"] += 1
+                context.content_index += 1
 
         except Exception as e:
             logger.warning(f"Error converting agent update: {e}")
-            events.append(await self._create_error_event(str(e), context))
+            events.append(self._create_error_event(str(e), context))
 
         return events
 
-    async def _convert_workflow_event(self, event: Any, context: dict[str, Any]) -> Sequence[Any]:
+    async def _convert_workflow_event(self, event: Any, context: ConversionContext) -> Sequence[Any]:
         """Convert workflow event to structured OpenAI events.
 
         Args:
@@ -267,112 +499,123 @@ class MessageMapper:
             List of OpenAI response stream events
         """
         try:
-            # Get event data and serialize if it's a SerializationMixin
-            event_data = getattr(event, "data", None)
-            if event_data is not None and hasattr(event_data, "to_dict"):
-                # SerializationMixin objects - convert to dict for JSON serialization
-                try:
-                    event_data = event_data.to_dict()
-                except Exception as e:
-                    logger.debug(f"Failed to serialize event data with to_dict(): {e}")
-                    event_data = str(event_data)
+            # Read fields straight from __dict__ when available - plain event
+            # objects keep their attributes there, and dict.get skips the
+            # descriptor walk plus AttributeError handling of getattr-with-default.
+            fields = getattr(event, "__dict__", None)
+            if fields:
+                event_data = fields.get("data")
+                executor_id = fields.get("executor_id")
+            else:  # slotted or exotic event classes
+                event_data = getattr(event, "data", None)
+                executor_id = getattr(event, "executor_id", None)
+
+            # Serialize event data if it's a SerializationMixin
+            if event_data is not None:
+                # Single class-level probe (hits the type attribute cache) instead
+                # of hasattr + callable + instance getattr per event.
+                to_dict = getattr(type(event_data), "to_dict", None)
+                if to_dict is not None:
+                    # SerializationMixin objects - convert to dict for JSON serialization
+                    try:
+                        event_data = to_dict(event_data)
+                    except Exception as e:
+                        logger.debug(f"Failed to serialize event data with to_dict(): {e}")
+                        event_data = str(event_data)
 
             # Create structured workflow event
-            workflow_event = ResponseWorkflowEventComplete(
-                type="response.workflow_event.complete",
+            workflow_event = ResponseWorkflowEventComplete.model_construct(
+                type=_WORKFLOW_EVENT_TYPE,
                 data={
-                    "event_type": event.__class__.__name__,
+                    "event_type": type(event).__name__,
                     "data": event_data,
-                    "executor_id": getattr(event, "executor_id", None),
-                    "timestamp": datetime.now().isoformat(),
+                    "executor_id": executor_id,
+                    "timestamp": self._now_iso(context),
                 },
-                executor_id=getattr(event, "executor_id", None),
-                item_id=context["item_id"],
-                output_index=context["output_index"],
+                executor_id=executor_id,
+                item_id=context.item_id,
+                output_index=context.output_index,
                 sequence_number=self._next_sequence(context),
             )
 
-            return [workflow_event]
+            return (workflow_event,)
 
         except Exception as e:
             logger.warning(f"Error converting workflow event: {e}")
-            return [await self._create_error_event(str(e), context)]
+            return (self._create_error_event(str(e), context),)
 
     # Content type mappers - implementing our comprehensive mapping plan
 
-    async def _map_text_content(self, content: Any, context: dict[str, Any]) -> ResponseTextDeltaEvent:
+    def _map_text_content(self, content: Any, context: ConversionContext) -> ResponseTextDeltaEvent:
         """Map TextContent to ResponseTextDeltaEvent."""
         return self._create_text_delta_event(content.text, context)
 
-    async def _map_reasoning_content(self, content: Any, context: dict[str, Any]) -> ResponseReasoningTextDeltaEvent:
+    def _map_reasoning_content(self, content: Any, context: ConversionContext) -> ResponseReasoningTextDeltaEvent:
         """Map TextReasoningContent to ResponseReasoningTextDeltaEvent."""
-        return ResponseReasoningTextDeltaEvent(
-            type="response.reasoning_text.delta",
+        return ResponseReasoningTextDeltaEvent.model_construct(
+            type=_REASONING_DELTA_TYPE,
             delta=content.text,
-            item_id=context["item_id"],
-            output_index=context["output_index"],
-            content_index=context["content_index"],
+            item_id=context.item_id,
+            output_index=context.output_index,
+            content_index=context.content_index,
             sequence_number=self._next_sequence(context),
         )
 
-    async def _map_function_call_content(
-        self, content: Any, context: dict[str, Any]
+    def _map_function_call_content(
+        self, content: Any, context: ConversionContext
     ) -> list[ResponseFunctionCallArgumentsDeltaEvent]:
         """Map FunctionCallContent to ResponseFunctionCallArgumentsDeltaEvent(s)."""
         events = []
 
         # For streaming, need to chunk the arguments JSON
-        args_str = json.dumps(content.arguments) if hasattr(content, "arguments") and content.arguments else "{}"
+        args_str = _json_dumps(content.arguments) if hasattr(content, "arguments") and content.arguments else "{}"
 
         # Chunk the JSON string for streaming
         for chunk in self._chunk_json_string(args_str):
             events.append(
-                ResponseFunctionCallArgumentsDeltaEvent(
-                    type="response.function_call_arguments.delta",
+                ResponseFunctionCallArgumentsDeltaEvent.model_construct(
+                    type=_FUNCTION_ARGS_DELTA_TYPE,
                     delta=chunk,
-                    item_id=context["item_id"],
-                    output_index=context["output_index"],
+                    item_id=context.item_id,
+                    output_index=context.output_index,
                     sequence_number=self._next_sequence(context),
                 )
             )
 
         return events
 
-    async def _map_function_result_content(
-        self, content: Any, context: dict[str, Any]
-    ) -> ResponseFunctionResultComplete:
+    def _map_function_result_content(self, content: Any, context: ConversionContext) -> ResponseFunctionResultComplete:
         """Map FunctionResultContent to structured event."""
-        return ResponseFunctionResultComplete(
-            type="response.function_result.complete",
+        call_id = getattr(content, "call_id", None) or self._short_id("call_")
+        return ResponseFunctionResultComplete.model_construct(
+            type=_FUNCTION_RESULT_TYPE,
             data={
-                "call_id": getattr(content, "call_id", f"call_{uuid.uuid4().hex[:8]}"),
+                "call_id": call_id,
                 "result": getattr(content, "result", None),
                 "status": "completed" if not getattr(content, "exception", None) else "failed",
                 "exception": str(getattr(content, "exception", None)) if getattr(content, "exception", None) else None,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._now_iso(context),
             },
-            call_id=getattr(content, "call_id", f"call_{uuid.uuid4().hex[:8]}"),
-            item_id=context["item_id"],
-            output_index=context["output_index"],
+            call_id=call_id,
+            item_id=context.item_id,
+            output_index=context.output_index,
             sequence_number=self._next_sequence(context),
         )
 
-    async def _map_error_content(self, content: Any, context: dict[str, Any]) -> ResponseErrorEvent:
+    def _map_error_content(self, content: Any, context: ConversionContext) -> ResponseErrorEvent:
         """Map ErrorContent to ResponseErrorEvent."""
-        return ResponseErrorEvent(
-            type="error",
+        return ResponseErrorEvent.model_construct(
+            type=_TYPE_ERROR,
             message=getattr(content, "message", "Unknown error"),
             code=getattr(content, "error_code", None),
             param=None,
             sequence_number=self._next_sequence(context),
         )
 
-    async def _map_usage_content(self, content: Any, context: dict[str, Any]) -> ResponseUsageEventComplete:
+    def _map_usage_content(self, content: Any, context: ConversionContext) -> ResponseUsageEventComplete:
         """Map UsageContent to structured usage event."""
         # Store usage data in context for aggregation
-        if "usage_data" not in context:
-            context["usage_data"] = []
-        context["usage_data"].append(content)
+        context.usage_data.append(content)
 
         # Extract usage from UsageContent.details (UsageDetails object)
         details = getattr(content, "details", None)
@@ -385,85 +628,101 @@ class MessageMapper:
             prompt_tokens = getattr(details, "input_token_count", 0) or 0
             completion_tokens = getattr(details, "output_token_count", 0) or 0
 
-        return ResponseUsageEventComplete(
-            type="response.usage.complete",
+        return ResponseUsageEventComplete.model_construct(
+            type=_USAGE_COMPLETE_TYPE,
             data={
-                "usage_data": details.to_dict() if details and hasattr(details, "to_dict") else {},
+                "usage_data": details.to_dict()
+                if details is not None and getattr(type(details), "to_dict", None)
+                else {},
                 "total_tokens": total_tokens,
                 "completion_tokens": completion_tokens,
                 "prompt_tokens": prompt_tokens,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._now_iso(context),
             },
-            item_id=context["item_id"],
-            output_index=context["output_index"],
+            item_id=context.item_id,
+            output_index=context.output_index,
             sequence_number=self._next_sequence(context),
         )
 
-    async def _map_data_content(self, content: Any, context: dict[str, Any]) -> ResponseTraceEventComplete:
+    def _map_data_content(self, content: Any, context: ConversionContext) -> ResponseTraceEventComplete | list[Any]:
         """Map DataContent to structured trace event."""
-        return ResponseTraceEventComplete(
-            type="response.trace.complete",
+        if not self.trace_enabled:
+            return []
+        data = getattr(content, "data", None)
+        # Sized payloads report their length directly; stringifying a large
+        # binary blob just to measure it would copy the whole payload.
+        size_bytes = len(data) if isinstance(data, (str, bytes, bytearray, memoryview)) else 0
+        return ResponseTraceEventComplete.model_construct(
+            type=_TRACE_COMPLETE_TYPE,
             data={
                 "content_type": "data",
-                "data": getattr(content, "data", None),
+                "data": data,
                 "mime_type": getattr(content, "mime_type", "application/octet-stream"),
-                "size_bytes": len(str(getattr(content, "data", ""))) if getattr(content, "data", None) else 0,
-                "timestamp": datetime.now().isoformat(),
+                "size_bytes": size_bytes,
+                "timestamp": self._now_iso(context),
             },
-            item_id=context["item_id"],
-            output_index=context["output_index"],
+            item_id=context.item_id,
+            output_index=context.output_index,
             sequence_number=self._next_sequence(context),
         )
 
-    async def _map_uri_content(self, content: Any, context: dict[str, Any]) -> ResponseTraceEventComplete:
+    def _map_uri_content(self, content: Any, context: ConversionContext) -> ResponseTraceEventComplete | list[Any]:
         """Map UriContent to structured trace event."""
-        return ResponseTraceEventComplete(
-            type="response.trace.complete",
+        if not self.trace_enabled:
+            return []
+        return ResponseTraceEventComplete.model_construct(
+            type=_TRACE_COMPLETE_TYPE,
             data={
                 "content_type": "uri",
                 "uri": getattr(content, "uri", ""),
                 "mime_type": getattr(content, "mime_type", "text/plain"),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._now_iso(context),
             },
-            item_id=context["item_id"],
-            output_index=context["output_index"],
+            item_id=context.item_id,
+            output_index=context.output_index,
             sequence_number=self._next_sequence(context),
         )
 
-    async def _map_hosted_file_content(self, content: Any, context: dict[str, Any]) -> ResponseTraceEventComplete:
+    def _map_hosted_file_content(
+        self, content: Any, context: ConversionContext
+    ) -> ResponseTraceEventComplete | list[Any]:
         """Map HostedFileContent to structured trace event."""
-        return ResponseTraceEventComplete(
-            type="response.trace.complete",
+        if not self.trace_enabled:
+            return []
+        return ResponseTraceEventComplete.model_construct(
+            type=_TRACE_COMPLETE_TYPE,
             data={
                 "content_type": "hosted_file",
                 "file_id": getattr(content, "file_id", "unknown"),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._now_iso(context),
             },
-            item_id=context["item_id"],
-            output_index=context["output_index"],
+            item_id=context.item_id,
+            output_index=context.output_index,
             sequence_number=self._next_sequence(context),
         )
 
-    async def _map_hosted_vector_store_content(
-        self, content: Any, context: dict[str, Any]
-    ) -> ResponseTraceEventComplete:
+    def _map_hosted_vector_store_content(
+        self, content: Any, context: ConversionContext
+    ) -> ResponseTraceEventComplete | list[Any]:
         """Map HostedVectorStoreContent to structured trace event."""
-        return ResponseTraceEventComplete(
-            type="response.trace.complete",
+        if not self.trace_enabled:
+            return []
+        return ResponseTraceEventComplete.model_construct(
+            type=_TRACE_COMPLETE_TYPE,
             data={
                 "content_type": "hosted_vector_store",
                 "vector_store_id": getattr(content, "vector_store_id", "unknown"),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._now_iso(context),
             },
-            item_id=context["item_id"],
-            output_index=context["output_index"],
+            item_id=context.item_id,
+            output_index=context.output_index,
             sequence_number=self._next_sequence(context),
         )
 
-    async def _map_approval_request_content(self, content: Any, context: dict[str, Any]) -> dict[str, Any]:
+    def _map_approval_request_content(self, content: Any, context: ConversionContext) -> dict[str, Any]:
         """Map FunctionApprovalRequestContent to custom event."""
         return {
-            "type": "response.function_approval.requested",
+            "type": _APPROVAL_REQUESTED_TYPE,
             "request_id": getattr(content, "id", "unknown"),
             "function_call": {
                 "id": getattr(content.function_call, "call_id", "") if hasattr(content, "function_call") else "",
@@ -472,48 +731,62 @@ class MessageMapper:
                 if hasattr(content, "function_call")
                 else {},
             },
-            "item_id": context["item_id"],
-            "output_index": context["output_index"],
+            "item_id": context.item_id,
+            "output_index": context.output_index,
             "sequence_number": self._next_sequence(context),
         }
 
-    async def _map_approval_response_content(self, content: Any, context: dict[str, Any]) -> dict[str, Any]:
+    def _map_approval_response_content(self, content: Any, context: ConversionContext) -> dict[str, Any]:
         """Map FunctionApprovalResponseContent to custom event."""
         return {
-            "type": "response.function_approval.responded",
+            "type": _APPROVAL_RESPONDED_TYPE,
             "request_id": getattr(content, "request_id", "unknown"),
             "approved": getattr(content, "approved", False),
-            "item_id": context["item_id"],
-            "output_index": context["output_index"],
+            "item_id": context.item_id,
+            "output_index": context.output_index,
             "sequence_number": self._next_sequence(context),
         }
 
     # Helper methods
 
-    def _create_text_delta_event(self, text: str, context: dict[str, Any]) -> ResponseTextDeltaEvent:
-        """Create a ResponseTextDeltaEvent."""
-        return ResponseTextDeltaEvent(
-            type="response.output_text.delta",
-            item_id=context["item_id"],
-            output_index=context["output_index"],
-            content_index=context["content_index"],
-            delta=text,
-            sequence_number=self._next_sequence(context),
-            logprobs=[],
+    def _create_text_delta_event(self, text: str, context: ConversionContext) -> ResponseTextDeltaEvent:
+        """Create a ResponseTextDeltaEvent from the per-request template.
+
+        Only delta, content_index and sequence_number vary between the deltas
+        of one request, so copy a prebuilt template with those fields updated
+        instead of assembling the full model per token.
+        """
+        template = context.text_delta_template
+        if template is None:
+            template = context.text_delta_template = ResponseTextDeltaEvent.model_construct(
+                type=_TEXT_DELTA_TYPE,
+                item_id=context.item_id,
+                output_index=context.output_index,
+                content_index=0,
+                delta="",
+                sequence_number=0,
+                logprobs=[],
+            )
+        return template.model_copy(
+            update={
+                "delta": text,
+                "content_index": context.content_index,
+                "sequence_number": self._next_sequence(context),
+            }
         )
 
-    async def _create_error_event(self, message: str, context: dict[str, Any]) -> ResponseErrorEvent:
+    def _create_error_event(self, message: str, context: ConversionContext) -> ResponseErrorEvent:
         """Create a ResponseErrorEvent."""
-        return ResponseErrorEvent(
-            type="error", message=message, code=None, param=None, sequence_number=self._next_sequence(context)
+        return ResponseErrorEvent.model_construct(
+            type=_TYPE_ERROR, message=message, code=None, param=None, sequence_number=self._next_sequence(context)
         )
 
-    async def _create_unknown_event(self, event_data: Any, context: dict[str, Any]) -> ResponseStreamEvent:
+    def _create_unknown_event(self, event_data: Any, context: ConversionContext) -> ResponseStreamEvent:
         """Create event for unknown event types."""
         text = f"Unknown event: {event_data!s}\\n"
         return self._create_text_delta_event(text, context)
 
-    async def _create_unknown_content_event(self, content: Any, context: dict[str, Any]) -> ResponseStreamEvent:
+    def _create_unknown_content_event(self, content: Any, context: ConversionContext) -> ResponseStreamEvent:
         """Create event for unknown content types."""
         content_type = content.__class__.__name__
         text = f"⚠️ Unknown content type: {content_type}\\n"
@@ -533,25 +806,17 @@ class MessageMapper:
             type="message",
             role="assistant",
             content=[response_output_text],
-            id=f"msg_{uuid.uuid4().hex[:8]}",
+            id=self._short_id("msg_"),
             status="completed",
         )
 
-        usage = ResponseUsage(
-            input_tokens=0,
-            output_tokens=0,
-            total_tokens=0,
-            input_tokens_details=InputTokensDetails(cached_tokens=0),
-            output_tokens_details=OutputTokensDetails(reasoning_tokens=0),
-        )
-
         return OpenAIResponse(
-            id=f"resp_{uuid.uuid4().hex[:12]}",
+            id=self._short_id("resp_", 12),
             object="response",
-            created_at=datetime.now().timestamp(),
+            created_at=time.time(),
             model=request.model,
             output=[response_output_message],
-            usage=usage,
+            usage=_ZERO_USAGE,
             parallel_tool_calls=False,
             tool_choice="none",
             tools=[],
@@ -151,7 +151,7 @@ async def test_unknown_content_fallback(mapper: MessageMapper, test_request: Age
     unknown_content = MockUnknownContent()
 
     # This should trigger the unknown content fallback in _convert_agent_update
-    event = await mapper._create_unknown_content_event(unknown_content, context)
+    event = mapper._create_unknown_content_event(unknown_content, context)
 
     assert event.type == "response.output_text.delta"
     assert "Unknown content type" in event.delta
@@ -1,76 +1,142 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import functools
 import glob
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-import tomli
-from poethepoet.app import PoeThePoet
-from rich import print
+try:
+    import tomllib as _toml  # type: ignore # Python 3.11+
+except ModuleNotFoundError:  # Python 3.10
+    import tomli as _toml  # type: ignore
+
+from rich.console import Console
+
+# One console for the whole run; every message here is a plain string, so
+# markup parsing and syntax highlighting are switched off rather than paid
+# per print call.
+_console = Console(highlight=False)
 
 
 def discover_projects(workspace_pyproject_file: Path) -> list[Path]:
     with workspace_pyproject_file.open("rb") as f:
-        data = tomli.load(f)
+        data = _toml.load(f)
 
     projects = data["tool"]["uv"]["workspace"]["members"]
     exclude = data["tool"]["uv"]["workspace"].get("exclude", [])
 
-    all_projects: list[Path] = []
+    # Compare normalized strings while collecting and filtering; the checks
+    # only need equality, and building a Path per glob match just to compare
+    # it does parsing work that gets thrown away. Survivors are converted to
+    # Path once on return.
+    all_projects: list[str] = []
     for project in projects:
         if "*" in project:
             globbed = glob.glob(str(project), root_dir=workspace_pyproject_file.parent)
-            globbed_paths = [Path(p) for p in globbed]
-            all_projects.extend(globbed_paths)
+            all_projects.extend(os.path.normpath(p) for p in globbed)
         else:
-            all_projects.append(Path(project))
+            all_projects.append(os.path.normpath(project))
 
+    # Expand every exclude entry into one set up front so filtering is a
+    # single pass with hashed membership checks instead of rebuilding the
+    # project list once per exclude entry.
+    exclude_set: set[str] = set()
     for project in exclude:
         if "*" in project:
             globbed = glob.glob(str(project), root_dir=workspace_pyproject_file.parent)
-            globbed_paths = [Path(p) for p in globbed]
-            all_projects = [p for p in all_projects if p not in globbed_paths]
+            exclude_set.update(os.path.normpath(p) for p in globbed)
         else:
-            all_projects = [p for p in all_projects if p != Path(project)]
+            exclude_set.add(os.path.normpath(project))
 
-    return all_projects
+    # dict.fromkeys drops duplicates from overlapping globs while keeping order.
+    return [Path(p) for p in dict.fromkeys(all_projects) if p not in exclude_set]
 
 
+@functools.lru_cache(maxsize=None)
 def extract_poe_tasks(file: Path) -> set[str]:
+    """Return the poe task names defined in a pyproject file.
+
+    Memoized on the (resolved) path so shared include files are parsed once
+    instead of re-read for every package that includes them.
+    """
     with file.open("rb") as f:
-        data = tomli.load(f)
+        data = _toml.load(f)
 
     tasks = set(data.get("tool", {}).get("poe", {}).get("tasks", {}).keys())
 
     # Check if there is an include too
     include: str | None = data.get("tool", {}).get("poe", {}).get("include", None)
     if include:
-        include_file = file.parent / include
+        include_file = (file.parent / include).resolve()
         if include_file.exists():
             tasks = tasks.union(extract_poe_tasks(include_file))
 
     return tasks
 
 
+def _run_poe(project: Path, cli_args: list[str]) -> int:
+    """Run a poe task in a project. Top level so process pools can pickle it."""
+    # Imported lazily: poethepoet drags in a sizable dependency graph, and an
+    # invocation where no package defines the task never needs it.
+    from poethepoet.app import PoeThePoet
+
+    app = PoeThePoet(cwd=project)
+    return int(app(cli_args=cli_args) or 0)
+
+
 def main() -> None:
+    args = sys.argv[1:]
+
+    # Optional -j/--parallel N runs per-package tasks (test, lint, format,
+    # ...) across processes; the default stays strictly sequential for tasks
+    # that share state. The flag must come before the task name.
+    jobs = 1
+    if args and args[0] in ("-j", "--parallel"):
+        if len(args) < 2:
+            _console.print("Please provide a job count after -j/--parallel (before the task name)", markup=False)
+            sys.exit(1)
+        try:
+            jobs = max(1, int(args[1]))
+        except ValueError:
+            _console.print(f"Job count for -j/--parallel must be an integer, got {args[1]!r}", markup=False)
+            sys.exit(1)
+        args = args[2:]
+
+    if not args:
+        _console.print("Please provide a task name", markup=False)
+        sys.exit(1)
+
+    task_name = args[0]
     pyproject_file = Path(__file__).parent / "pyproject.toml"
     projects = discover_projects(pyproject_file)
 
-    if len(sys.argv) < 2:
-        print("Please provide a task name")
-        sys.exit(1)
+    # Parse every package's pyproject in a thread pool: the reads are
+    # independent and I/O-bound, so they overlap instead of serializing.
+    with ThreadPoolExecutor(max_workers=min(32, len(projects) or 1)) as executor:
+        task_sets = list(executor.map(lambda p: extract_poe_tasks((p / "pyproject.toml").resolve()), projects))
 
-    task_name = sys.argv[1]
-    for project in projects:
-        tasks = extract_poe_tasks(project / "pyproject.toml")
+    matching: list[Path] = []
+    for project, tasks in zip(projects, task_sets, strict=False):
         if task_name in tasks:
-            print(f"Running task {task_name} in {project}")
-            app = PoeThePoet(cwd=project)
-            result = app(cli_args=sys.argv[1:])
+            matching.append(project)
+        else:
+            _console.print(f"Task {task_name} not found in {project}", markup=False)
+
+    if jobs > 1 and len(matching) > 1:
+        for project in matching:
+            _console.print(f"Running task {task_name} in {project}", markup=False)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(matching))) as pool:
+            codes = list(pool.map(_run_poe, matching, [args] * len(matching)))
+        if any(codes):
+            sys.exit(max(codes))
+    else:
+        for project in matching:
+            _console.print(f"Running task {task_name} in {project}", markup=False)
+            result = _run_poe(project, args)
             if result:
                 sys.exit(result)
-        else:
-            print(f"Task {task_name} not found in {project}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import asyncio
+import random
+from typing import Any
 
 from agent_framework import ChatAgent, HostedFileSearchTool, HostedVectorStoreContent
 from agent_framework.openai import OpenAIAssistantsClient
@@ -15,16 +17,50 @@ for document-based question answering and information retrieval.
 # Helper functions
 
 
+async def poll_vector_store_file(
+    client: OpenAIAssistantsClient,
+    vector_store_id: str,
+    file_id: str,
+    initial: float = 0.1,
+    factor: float = 2.0,
+    cap: float = 2.0,
+    max_wait: float = 120.0,
+) -> Any:
+    """Attach a file to a vector store and poll its status with exponential backoff.
+
+    The SDK's create_and_poll polls at a fixed interval; backing off from a
+    short initial delay (with jitter so concurrent runs don't sync up) gets
+    small files through with fewer requests while capping the delay for
+    large ones. Total wait is bounded by max_wait.
+    """
+    await client.client.vector_stores.files.create(vector_store_id=vector_store_id, file_id=file_id)
+
+    async def _poll() -> Any:
+        delay = initial
+        while True:
+            result = await client.client.vector_stores.files.retrieve(file_id=file_id, vector_store_id=vector_store_id)
+            if result.status not in ("in_progress", None):
+                return result
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(cap, delay * factor)
+
+    return await asyncio.wait_for(_poll(), timeout=max_wait)
+
+
 async def create_vector_store(client: OpenAIAssistantsClient) -> tuple[str, HostedVectorStoreContent]:
     """Create a vector store with sample documents."""
-    file = await client.client.files.create(
-        file=("todays_weather.txt", b"The weather today is sunny with a high of 75F."), purpose="user_data"
-    )
-    vector_store = await client.client.vector_stores.create(
-        name="knowledge_base",
-        expires_after={"anchor": "last_active_at", "days": 1},
+    # The file upload and the vector store creation are independent, so run
+    # them concurrently; only attaching the file to the store needs both.
+    file, vector_store = await asyncio.gather(
+        client.client.files.create(
+            file=("todays_weather.txt", b"The weather today is sunny with a high of 75F."), purpose="user_data"
+        ),
+        client.client.vector_stores.create(
+            name="knowledge_base",
+            expires_after={"anchor": "last_active_at", "days": 1},
+        ),
     )
-    result = await client.client.vector_stores.files.create_and_poll(vector_store_id=vector_store.id, file_id=file.id)
+    result = await poll_vector_store_file(client, vector_store.id, file.id)
     if result.last_error is not None:
         raise Exception(f"Vector store file processing failed with status: {result.last_error.message}")
 
@@ -33,9 +69,13 @@ async def create_vector_store(client: OpenAIAssistantsClient) -> tuple[str, Host
 
 async def delete_vector_store(client: OpenAIAssistantsClient, file_id: str, vector_store_id: str) -> None:
     """Delete the vector store after using it."""
-
-    await client.client.vector_stores.delete(vector_store_id=vector_store_id)
-    await client.client.files.delete(file_id=file_id)
+    # The two deletions are independent; run them concurrently, and don't let
+    # one failure leak the other resource.
+    await asyncio.gather(
+        client.client.vector_stores.delete(vector_store_id=vector_store_id),
+        client.client.files.delete(file_id=file_id),
+        return_exceptions=True,
+    )
 
 
 async def main() -> None:
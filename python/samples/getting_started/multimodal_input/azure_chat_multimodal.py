@@ -16,7 +16,10 @@ async def test_image() -> None:
     # environment variables to be set.
     # Alternatively, you can pass deployment_name explicitly:
     # client = AzureOpenAIChatClient(credential=AzureCliCredential(), deployment_name="your-deployment-name")
-    client = AzureOpenAIChatClient(credential=AzureCliCredential())
+    # Credential and client construction do blocking work (Azure CLI token
+    # lookup); run them in a worker thread so the event loop stays free.
+    credential = await asyncio.to_thread(AzureCliCredential)
+    client = await asyncio.to_thread(AzureOpenAIChatClient, credential=credential)
 
     # Fetch image from httpbin
     image_url = "https://httpbin.org/image/jpeg"
@@ -3,65 +3,94 @@
 import asyncio
 import base64
 import struct
+from typing import Any
 
 import requests
 from agent_framework import ChatMessage, DataContent, Role, TextContent
 from agent_framework.openai import OpenAIChatClient
 
+# Minimal WAV file (0.1 seconds of silence), encoded once at module load so
+# repeated runs don't rebuild and re-encode the same constant payload.
+_SILENT_WAV = (
+    b"RIFF"
+    + struct.pack("<I", 44)  # file size
+    + b"WAVEfmt "
+    + struct.pack("<I", 16)  # fmt chunk
+    + struct.pack("<HHIIHH", 1, 1, 8000, 16000, 2, 16)  # PCM, mono, 8kHz
+    + b"data"
+    + struct.pack("<I", 1600)  # data chunk
+    + b"\x00" * 1600  # 0.1 sec silence
+)
+_SILENT_WAV_DATA_URI = f"data:audio/wav;base64,{base64.b64encode(_SILENT_WAV).decode()}"
 
-async def test_image() -> None:
+
+def fetch_image_data_uri(url: str, media_type: str) -> str:
+    """Fetch an image and return it as a base64 data URI."""
+    response = requests.get(url)
+    return f"data:{media_type};base64,{base64.b64encode(response.content).decode()}"
+
+
+async def test_image() -> Any:
     """Test image analysis with OpenAI."""
     client = OpenAIChatClient(model_id="gpt-4o")
 
-    # Fetch image from httpbin
-    image_url = "https://httpbin.org/image/jpeg"
-    response = requests.get(image_url)
-    image_b64 = base64.b64encode(response.content).decode()
-    image_uri = f"data:image/jpeg;base64,{image_b64}"
+    image_uri = fetch_image_data_uri("https://httpbin.org/image/jpeg", "image/jpeg")
 
     message = ChatMessage(
         role=Role.USER,
         contents=[TextContent(text="What's in this image?"), DataContent(uri=image_uri, media_type="image/jpeg")],
     )
 
-    response = await client.get_response(message)
-    print(f"Image Response: {response}")
+    return await client.get_response(message)
 
 
-async def test_audio() -> None:
-    """Test audio analysis with OpenAI."""
-    client = OpenAIChatClient(model_id="gpt-4o-audio-preview")
+async def test_image_batch() -> Any:
+    """Analyze several images with a single request.
+
+    Grouping homogeneous images under one shared prompt amortizes the prompt
+    tokens and the request round trip instead of paying both per image.
+    """
+    client = OpenAIChatClient(model_id="gpt-4o")
 
-    # Create minimal WAV file (0.1 seconds of silence)
-    wav_header = (
-        b"RIFF"
-        + struct.pack("<I", 44)  # file size
-        + b"WAVEfmt "
-        + struct.pack("<I", 16)  # fmt chunk
-        + struct.pack("<HHIIHH", 1, 1, 8000, 16000, 2, 16)  # PCM, mono, 8kHz
-        + b"data"
-        + struct.pack("<I", 1600)  # data chunk
-        + b"\x00" * 1600  # 0.1 sec silence
+    images = [
+        DataContent(uri=fetch_image_data_uri("https://httpbin.org/image/jpeg", "image/jpeg"), media_type="image/jpeg"),
+        DataContent(uri=fetch_image_data_uri("https://httpbin.org/image/png", "image/png"), media_type="image/png"),
+    ]
+    message = ChatMessage(
+        role=Role.USER,
+        contents=[TextContent(text="Describe each of these images in one sentence."), *images],
     )
-    audio_b64 = base64.b64encode(wav_header).decode()
-    audio_uri = f"data:audio/wav;base64,{audio_b64}"
+
+    return await client.get_response(message)
+
+
+async def test_audio() -> Any:
+    """Test audio analysis with OpenAI."""
+    client = OpenAIChatClient(model_id="gpt-4o-audio-preview")
 
     message = ChatMessage(
         role=Role.USER,
         contents=[
             TextContent(text="What do you hear in this audio?"),
-            DataContent(uri=audio_uri, media_type="audio/wav"),
+            DataContent(uri=_SILENT_WAV_DATA_URI, media_type="audio/wav"),
         ],
     )
 
-    response = await client.get_response(message)
-    print(f"Audio Response: {response}")
+    return await client.get_response(message)
 
 
 async def main() -> None:
     print("=== Testing OpenAI Multimodal ===")
-    await test_image()
-    await test_audio()
+    # The image and audio examples are independent API calls, so run them
+    # concurrently and print the results in order; total wall time is roughly
+    # the slowest call instead of the sum of both. Failures (e.g. a missing
+    # API key) propagate as a normal traceback rather than being swallowed.
+    image_response, batch_response, audio_response = await asyncio.gather(
+        test_image(), test_image_batch(), test_audio()
+    )
+    print(f"Image Response: {image_response}")
+    print(f"Image Batch Response: {batch_response}")
+    print(f"Audio Response: {audio_response}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import asyncio
+import os
 from random import randint
 from typing import Annotated
 
@@ -26,32 +27,44 @@ async def get_weather(
     return f"The weather in {location} is {conditions[randint(0, 3)]} with a high of {randint(10, 30)}°C."
 
 
+async def run_agent_chat() -> None:
+    """Run the agent chat scenario."""
+    questions = ["What's the weather in Amsterdam?", "and in Paris, and which is better?", "Why is the sky blue?"]
+
+    agent = ChatAgent(
+        chat_client=OpenAIChatClient(),
+        tools=get_weather,
+        name="WeatherAgent",
+        instructions="You are a weather assistant.",
+    )
+    thread = agent.get_new_thread()
+    for question in questions:
+        print(f"User: {question}")
+        print(f"{agent.display_name}: ", end="")
+        async for update in agent.run_stream(
+            question,
+            thread=thread,
+        ):
+            if update.text:
+                print(update.text, end="")
+
+
 async def main():
+    # When telemetry is explicitly disabled, skip provider setup and span
+    # creation entirely instead of paying the SDK's lazy initialization cost
+    # for spans that would never be exported.
+    if os.getenv("OTEL_SDK_DISABLED") == "true":
+        await run_agent_chat()
+        return
+
     # This will enable tracing and create the necessary tracing, logging and metrics providers
     # based on environment variables. See the .env.example file for the available configuration options.
     setup_observability()
 
-    questions = ["What's the weather in Amsterdam?", "and in Paris, and which is better?", "Why is the sky blue?"]
-
     with get_tracer().start_as_current_span("Scenario: Agent Chat", kind=SpanKind.CLIENT) as current_span:
         print(f"Trace ID: {format_trace_id(current_span.get_span_context().trace_id)}")
 
-        agent = ChatAgent(
-            chat_client=OpenAIChatClient(),
-            tools=get_weather,
-            name="WeatherAgent",
-            instructions="You are a weather assistant.",
-        )
-        thread = agent.get_new_thread()
-        for question in questions:
-            print(f"User: {question}")
-            print(f"{agent.display_name}: ", end="")
-            async for update in agent.run_stream(
-                question,
-                thread=thread,
-            ):
-                if update.text:
-                    print(update.text, end="")
+        await run_agent_chat()
 
 
 if __name__ == "__main__":
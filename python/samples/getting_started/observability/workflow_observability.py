@@ -1,6 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import asyncio
+import logging
+import os
 
 from agent_framework import (
     Executor,
@@ -14,6 +16,8 @@ from opentelemetry.trace import SpanKind
 from opentelemetry.trace.span import format_trace_id
 from typing_extensions import Never
 
+logger = logging.getLogger(__name__)
+
 """
 This sample shows the telemetry collected when running a Agent Framework workflow.
 
@@ -31,9 +35,9 @@ class UpperCaseExecutor(Executor):
     @handler
     async def to_upper_case(self, text: str, ctx: WorkflowContext[str]) -> None:
         """Execute the task by converting the input string to uppercase."""
-        print(f"UpperCaseExecutor: Processing '{text}'")
+        logger.debug("UpperCaseExecutor: Processing %r", text)
         result = text.upper()
-        print(f"UpperCaseExecutor: Result '{result}'")
+        logger.debug("UpperCaseExecutor: Result %r", result)
 
         # Send the result to the next executor in the workflow.
         await ctx.send_message(result)
@@ -45,9 +49,9 @@ class ReverseTextExecutor(Executor):
     @handler
     async def reverse_text(self, text: str, ctx: WorkflowContext[Never, str]) -> None:
         """Execute the task by reversing the input string."""
-        print(f"ReverseTextExecutor: Processing '{text}'")
+        logger.debug("ReverseTextExecutor: Processing %r", text)
         result = text[::-1]
-        print(f"ReverseTextExecutor: Result '{result}'")
+        logger.debug("ReverseTextExecutor: Result %r", result)
 
         # Yield the output.
         await ctx.yield_output(result)
@@ -76,11 +80,12 @@ async def run_sequential_workflow() -> None:
     input_text = "hello world"
     print(f"Starting workflow with input: '{input_text}'")
 
+    # Filter on the producer side so only WorkflowOutputEvent instances are
+    # yielded; intermediate executor/status events never reach this loop.
     output_event = None
-    async for event in workflow.run_stream(input_text):
-        if isinstance(event, WorkflowOutputEvent):
-            # The WorkflowOutputEvent contains the final result.
-            output_event = event
+    async for event in workflow.run_stream(input_text, event_filter=WorkflowOutputEvent):
+        # The WorkflowOutputEvent contains the final result.
+        output_event = event
 
     if output_event:
         print(f"Workflow completed with result: '{output_event.data}'")
@@ -88,9 +93,52 @@ async def run_sequential_workflow() -> None:
 
 async def main():
     """Run the telemetry sample with a simple sequential workflow."""
+    # When telemetry is explicitly disabled, skip observability setup entirely:
+    # the first span otherwise pays for lazy provider init and exporter loading,
+    # which dominates cold start for a workflow this small.
+    if os.getenv("OTEL_SDK_DISABLED") == "true":
+        await run_sequential_workflow()
+        return
+
     # This will enable tracing and create the necessary tracing, logging and metrics providers
     # based on environment variables. See the .env.example file for the available configuration options.
-    setup_observability()
+    #
+    # Head-based sampling: with a ratio below 1.0 most traces become no-ops, so
+    # no span objects are allocated or exported for them. The decision is made
+    # once on the root span below and ParentBased propagates it to every child
+    # executor and message-publish span, so sampling is paid per workflow run,
+    # not per message.
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    ratio = float(os.getenv("OTEL_TRACES_SAMPLER_ARG", "1.0"))
+    # This two-executor demo emits a handful of spans per run; when they just
+    # go to the console there is no need for BatchSpanProcessor's background
+    # thread and 2048-slot queue, so use the synchronous processor. Real
+    # services exporting over OTLP should keep the batching default.
+    processor_factory = None if os.getenv("OTLP_ENDPOINT") else SimpleSpanProcessor
+    setup_observability(
+        sampler=ParentBased(TraceIdRatioBased(ratio)),
+        span_processor_factory=processor_factory,
+    )
+
+    # Alternative - tail-based sampling: keep in-process sampling at 1.0, set
+    # OTLP_ENDPOINT to a local OpenTelemetry Collector, and let the Collector
+    # decide at trace completion which traces are worth exporting (errors and
+    # slow runs), e.g. with this collector config:
+    #
+    #   processors:
+    #     tail_sampling:
+    #       policies:
+    #         - name: errors
+    #           type: status_code
+    #           status_code: {status_codes: [ERROR]}
+    #         - name: slow
+    #           type: latency
+    #           latency: {threshold_ms: 500}
+    #
+    # Spans are still created cheaply in-process, but only high-value traces
+    # are shipped and stored.
 
     with get_tracer().start_as_current_span("Sequential Workflow Scenario", kind=SpanKind.CLIENT) as current_span:
         print(f"Trace ID: {format_trace_id(current_span.get_span_context().trace_id)}")
@@ -1,18 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import asyncio
+import concurrent.futures
+import importlib.util
+import logging
 import sys
 from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
-# Ensure local getting_started package can be imported when running as a script.
-_SAMPLES_ROOT = Path(__file__).resolve().parents[3]
-if str(_SAMPLES_ROOT) not in sys.path:
-    sys.path.insert(0, str(_SAMPLES_ROOT))
-
-from agent_framework import (  # noqa: E402
+from agent_framework import (
     ChatMessage,
     Executor,
     FunctionCallContent,
@@ -26,12 +24,25 @@ from agent_framework import (  # noqa: E402
     WorkflowContext,
     handler,
 )
-from agent_framework.openai import OpenAIChatClient  # noqa: E402
-from getting_started.workflows.agents.workflow_as_agent_reflection_pattern import (  # noqa: E402
-    ReviewRequest,
-    ReviewResponse,
-    Worker,
+from agent_framework.openai import OpenAIChatClient
+
+# Load the sibling reflection-pattern module directly from its file instead of
+# inserting the samples root into sys.path: one exec_module call replaces a
+# path-walk of every entry on sys.path for the package import, and it works
+# the same whether this file runs as a script or not.
+_spec = importlib.util.spec_from_file_location(
+    "workflow_as_agent_reflection_pattern",
+    Path(__file__).with_name("workflow_as_agent_reflection_pattern.py"),
 )
+assert _spec is not None and _spec.loader is not None
+_reflection = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = _reflection
+_spec.loader.exec_module(_reflection)
+ReviewRequest = _reflection.ReviewRequest
+ReviewResponse = _reflection.ReviewResponse
+Worker = _reflection.Worker
+
+logger = logging.getLogger(__name__)
 
 """
 Sample: Workflow Agent with Human-in-the-Loop
@@ -73,8 +84,8 @@ class ReviewerWithHumanInTheLoop(Executor):
         # In this simplified example, we always escalate to a human manager.
         # See workflow_as_agent_reflection.py for an implementation
         # using an automated agent to make the review decision.
-        print(f"Reviewer: Evaluating response for request {request.request_id[:8]}...")
-        print("Reviewer: Escalating to human manager...")
+        logger.debug("Reviewer: Evaluating response for request %s...", request.request_id[:8])
+        logger.debug("Reviewer: Escalating to human manager...")
 
         # Forward the request to a human manager by sending a HumanReviewRequest.
         await ctx.send_message(
@@ -89,10 +100,10 @@ class ReviewerWithHumanInTheLoop(Executor):
         # Accept the human review response and forward it back to the Worker.
         human_response = response.data
         assert isinstance(human_response, ReviewResponse)
-        print(f"Reviewer: Accepting human review for request {human_response.request_id[:8]}...")
-        print(f"Reviewer: Human feedback: {human_response.feedback}")
-        print(f"Reviewer: Human approved: {human_response.approved}")
-        print("Reviewer: Forwarding human review back to worker...")
+        logger.debug("Reviewer: Accepting human review for request %s...", human_response.request_id[:8])
+        logger.debug("Reviewer: Human feedback: %s", human_response.feedback)
+        logger.debug("Reviewer: Human approved: %s", human_response.approved)
+        logger.debug("Reviewer: Forwarding human review back to worker...")
         await ctx.send_message(human_response, target_id=self._worker_id)
 
 
@@ -100,8 +111,16 @@ async def main() -> None:
     print("Starting Workflow Agent with Human-in-the-Loop Demo")
     print("=" * 50)
 
+    # Both agent.run calls below may offload blocking work to the loop's
+    # default executor; binding one small pool up front means they share
+    # threads instead of the loop lazily creating its own pool mid-run.
+    executor_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent-fw")
+    asyncio.get_running_loop().set_default_executor(executor_pool)
+
     # Create executors for the workflow.
     print("Creating chat client and executors...")
+    # One chat client serves both agent.run calls, so the underlying HTTP
+    # connection pool (and its TCP/TLS sessions) is reused across them.
     mini_chat_client = OpenAIChatClient(model_id="gpt-4.1-nano")
     worker = Worker(id="sub-worker", chat_client=mini_chat_client)
     request_info_executor = RequestInfoExecutor(id="request_info")
@@ -130,23 +149,31 @@ async def main() -> None:
         "Write code for parallel reading 1 million Files on disk and write to a sorted output file."
     )
 
-    # Locate the human review function call in the response messages.
-    human_review_function_call: FunctionCallContent | None = None
-    for message in response.messages:
-        for content in message.contents:
-            if isinstance(content, FunctionCallContent) and content.name == WorkflowAgent.REQUEST_INFO_FUNCTION_NAME:
-                human_review_function_call = content
+    # Locate the human review function call in the response messages with a
+    # single short-circuiting pass instead of walking every message after a
+    # match; the function name is hoisted out of the loop.
+    request_info_function_name = WorkflowAgent.REQUEST_INFO_FUNCTION_NAME
+    human_review_function_call: FunctionCallContent | None = next(
+        (
+            content
+            for message in response.messages
+            for content in message.contents
+            if isinstance(content, FunctionCallContent) and content.name == request_info_function_name
+        ),
+        None,
+    )
 
     # Handle the human review if required.
     if human_review_function_call:
-        # Parse the human review request arguments.
+        # Parse the human review request arguments. The JSON-string form is by
+        # far the common case, so it is checked first, and the nested class is
+        # bound to a local instead of walking the attribute chain per branch.
+        args_cls = WorkflowAgent.RequestInfoFunctionArgs
         human_request_args = human_review_function_call.arguments
         if isinstance(human_request_args, str):
-            request: WorkflowAgent.RequestInfoFunctionArgs = WorkflowAgent.RequestInfoFunctionArgs.from_json(
-                human_request_args
-            )
+            request: WorkflowAgent.RequestInfoFunctionArgs = args_cls.from_json(human_request_args)
         elif isinstance(human_request_args, Mapping):
-            request = WorkflowAgent.RequestInfoFunctionArgs.from_dict(dict(human_request_args))
+            request = args_cls.from_dict(dict(human_request_args))
         else:
             raise TypeError("Unexpected argument type for human review function call.")
 
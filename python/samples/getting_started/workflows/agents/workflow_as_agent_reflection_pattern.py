@@ -43,7 +43,7 @@ Prerequisites:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewRequest:
     """Structured request passed from Worker to Reviewer for evaluation."""
 
@@ -52,7 +52,7 @@ class ReviewRequest:
     agent_messages: list[ChatMessage]
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResponse:
     """Structured response from Reviewer back to Worker."""
 